@@ -16,6 +16,7 @@ runner — note Apple's DTDs are Apple-copyrighted, so they are located
 at runtime rather than redistributed with this project).
 """
 
+import contextlib
 import os
 import shutil
 import subprocess
@@ -60,6 +61,20 @@ def available_dtd_versions() -> list[str]:
     return sorted(versions, key=lambda v: [int(p) for p in v.split(".")])
 
 
+def _root_version(path: Path) -> str:
+    """The root element's ``version`` attribute (default ``"1.13"``).
+
+    Cheap version sniff: only the document up to the root start tag is
+    parsed (one read chunk), however large the file is.
+    """
+    from .safe_xml import safe_iterparse
+
+    with contextlib.closing(safe_iterparse(path)) as events:
+        for _event, root in events:
+            return root.get("version", "1.13")
+    return "1.13"
+
+
 def validate_against_dtd(
     fcpxml_path: str,
     version: Optional[str] = None,
@@ -86,10 +101,7 @@ def validate_against_dtd(
         return None, "xmllint not available on PATH"
 
     if version is None:
-        # Cheap version sniff without a full parse
-        from .safe_xml import safe_parse
-
-        version = safe_parse(str(path)).getroot().get("version", "1.13")
+        version = _root_version(path)
 
     dtd = find_apple_dtd(version)
     if dtd is None:
@@ -6,9 +6,12 @@ timelines, clips, markers, and other elements.
 """
 
 import operator
+import re
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from math import gcd
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -19,6 +22,9 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 # Maximum length for marker type strings to prevent memory abuse
 _MAX_MARKER_TYPE_LENGTH = 64
 
+# C0 control characters other than tab/LF/CR (null bytes included)
+_MARKER_TYPE_CONTROL_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
 
 class MarkerType(Enum):
     """Types of markers in Final Cut Pro.
@@ -65,7 +71,7 @@ class MarkerType(Enum):
         """
         if not isinstance(value, str):
             raise TypeError(f"Expected str, got {type(value).__name__}")
-        if '\x00' in value or any(ord(c) < 32 and c not in ('\n', '\r', '\t') for c in value):
+        if _MARKER_TYPE_CONTROL_CHARS.search(value):
             raise ValueError("Marker type contains invalid control characters")
         if len(value) > _MAX_MARKER_TYPE_LENGTH:
             raise ValueError(
@@ -74,20 +80,13 @@ class MarkerType(Enum):
         lowered = value.strip().lower()
         if not lowered:
             raise ValueError("Marker type cannot be empty")
-        # Accept legacy aliases from older specs (e.g. "todo-marker" → INCOMPLETE)
-        aliases = {
-            "todo-marker": "todo",
-            "completed-marker": "completed",
-            "chapter-marker": "chapter",
-        }
-        lowered = aliases.get(lowered, lowered)
         try:
-            return cls(lowered)
-        except ValueError:
+            return _MARKER_TYPE_LOOKUP[lowered]
+        except KeyError:
             raise ValueError(
                 f"Invalid marker type: '{value}'. "
                 f"Valid types: {', '.join(m.value for m in cls)}"
-            )
+            ) from None
 
     @classmethod
     def from_xml_element(cls, elem) -> 'MarkerType':
@@ -109,12 +108,7 @@ class MarkerType(Enum):
         """
         if elem.tag == 'chapter-marker':
             return cls.CHAPTER
-        completed = elem.get('completed')
-        if completed == '0':
-            return cls.INCOMPLETE
-        if completed == '1':
-            return cls.COMPLETED
-        return cls.STANDARD
+        return _COMPLETED_MARKER_TYPES.get(elem.get('completed'), cls.STANDARD)
 
     @property
     def xml_tag(self) -> str:
@@ -137,6 +131,24 @@ class MarkerType(Enum):
         return {}
 
 
+# Lowercase lookup for MarkerType.from_string(): every canonical value plus
+# legacy aliases from older specs (e.g. "todo-marker" → INCOMPLETE).
+_MARKER_TYPE_LOOKUP: Dict[str, MarkerType] = {
+    **{m.value: m for m in MarkerType},
+    "todo-marker": MarkerType.INCOMPLETE,
+    "completed-marker": MarkerType.COMPLETED,
+    "chapter-marker": MarkerType.CHAPTER,
+}
+
+# Exact completed-attribute values → MarkerType for MarkerType.from_xml_element().
+# Any other value (absent, padded, non-boolean) misses and falls back to STANDARD.
+# Strict-exact per spec: keep raw attribute strings as keys and never
+# normalise the value before lookup (see test_non_exact_completed_values_are_standard).
+_COMPLETED_MARKER_TYPES: Dict[Optional[str], MarkerType] = {
+    '0': MarkerType.INCOMPLETE,
+    '1': MarkerType.COMPLETED,
+}
+
 # Recognised marker XML tags — used by the parser for single-pass collection
 # and by the writer to validate element creation.
 MARKER_XML_TAGS = ('marker', 'chapter-marker')
@@ -215,14 +227,46 @@ _FCPXML_STANDARD_TIMEBASES = frozenset({
 })
 
 
+@lru_cache(maxsize=4096)
+def _time_value_from_string(cls: type, tc: str, fps: float) -> 'TimeValue':
+    """Flyweight pool behind TimeValue.from_timecode().
+
+    Documents repeat a small set of duration/offset strings, so parsed
+    values are shared instead of allocated per clip and marker.
+    """
+    return cls._parse_time_string(tc, fps)
+
+
+@lru_cache(maxsize=16384)
+def _format_fcpxml_time(numerator: int, denominator: int) -> str:
+    """Format a rational time for FCPXML; backs TimeValue.to_fcpxml().
+
+    Memoized because writes repeat the same handful of offsets, durations
+    and frame-rate fractions across every clip and marker.
+    """
+    if numerator == 0:
+        return "0s"
+    divisor = gcd(abs(numerator), denominator)
+    num, den = numerator // divisor, denominator // divisor
+    if den == 1:
+        return f"{num}s"
+    # Keep original denominator if simplification produces a non-standard
+    # denominator (not a multiple of common timebases: 24, 30, 25, 2400)
+    if den in _FCPXML_STANDARD_TIMEBASES:
+        return f"{num}/{den}s"
+    # Fall back to unsimplified form
+    return f"{numerator}/{denominator}s"
+
+
 @total_ordering
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeValue:
     """
     Represents time in FCPXML's rational format.
 
     FCPXML uses fractions of seconds (e.g., "90/30s" for 3 seconds at 30fps).
     This class handles conversion between timecode, seconds, and FCPXML format.
+    Instances are immutable values: arithmetic always returns a new TimeValue.
 
     Examples:
         TimeValue(90, 30)  # 3 seconds at 30fps
@@ -243,7 +287,7 @@ class TimeValue:
         # __hash__ assumes canonical form.  Without this, TimeValue(1, -2)
         # compares/hashes incorrectly against TimeValue(-1, 2).
         if self.denominator < 0:
-            # Use object.__setattr__ because dataclass may be frozen-like
+            # object.__setattr__ because the dataclass is frozen
             object.__setattr__(self, 'numerator', -self.numerator)
             object.__setattr__(self, 'denominator', -self.denominator)
 
@@ -258,7 +302,15 @@ class TimeValue:
         - "30s" - Seconds
         - "90/30s" - FCPXML rational format
         - "15f" - Frames
+
+        Results are memoized per ``(cls, tc, fps)``: TimeValue is immutable,
+        so the same rational string always yields one shared instance.
         """
+        return _time_value_from_string(cls, tc, fps)
+
+    @classmethod
+    def _parse_time_string(cls, tc: str, fps: float) -> 'TimeValue':
+        """Uncached body of from_timecode()."""
         if not tc:
             return cls(0, 1)
 
@@ -267,16 +319,15 @@ class TimeValue:
         # FCPXML format: "90/30s" or "30s"
         if tc.endswith('s'):
             tc_val = tc[:-1]
-            if '/' in tc_val:
-                parts = tc_val.split('/', 1)
-                num, denom = int(parts[0]), int(parts[1])
+            num, slash, denom = tc_val.partition('/')
+            if slash:
+                num, denom = int(num), int(denom)
                 if denom == 0:
                     raise ValueError(f"Zero denominator in timecode: {tc}")
                 return cls(num, denom)
-            else:
-                seconds = float(tc_val)
-                frames = int(round(seconds * fps))
-                return cls(frames, int(fps))
+            seconds = float(tc_val)
+            frames = int(round(seconds * fps))
+            return cls(frames, int(fps))
 
         # Frame format: "15f"
         if tc.endswith('f'):
@@ -321,15 +372,7 @@ class TimeValue:
         or stays a standard FCPXML timebase. Avoids producing denominators
         like 3, 7, etc. that FCP's DTD validator may reject.
         """
-        simplified = self.simplify()
-        if simplified.denominator == 1:
-            return f"{simplified.numerator}s"
-        # Keep original denominator if simplification produces a non-standard
-        # denominator (not a multiple of common timebases: 24, 30, 25, 2400)
-        if simplified.denominator in _FCPXML_STANDARD_TIMEBASES:
-            return f"{simplified.numerator}/{simplified.denominator}s"
-        # Fall back to unsimplified form
-        return f"{self.numerator}/{self.denominator}s"
+        return _format_fcpxml_time(self.numerator, self.denominator)
 
     def to_seconds(self) -> float:
         """Convert to decimal seconds."""
@@ -445,13 +488,14 @@ class TimeValue:
 # TIMECODE (Legacy compatibility - wraps TimeValue)
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Timecode:
     """
     Represents a timecode value.
 
     Note: This class exists for backwards compatibility with the parser.
-    New code should prefer TimeValue for rational time math.
+    New code should prefer TimeValue for rational time math.  Like
+    TimeValue it is an immutable value, so parsed instances can be shared.
     """
     frames: int
     frame_rate: float = 24.0
@@ -480,15 +524,10 @@ class Timecode:
         """Parse FCPXML rational time format (e.g., '3600/24s')."""
         if not rational_str:
             return cls(frames=0, frame_rate=frame_rate)
-        if rational_str.endswith('s'):
-            rational_str = rational_str[:-1]
-        if '/' in rational_str:
-            num, denom = rational_str.split('/')
-            seconds = int(num) / int(denom)
-        else:
-            seconds = float(rational_str)
-        frames = int(seconds * frame_rate)
-        return cls(frames=frames, frame_rate=frame_rate)
+        body = rational_str[:-1] if rational_str.endswith('s') else rational_str
+        num, slash, denom = body.partition('/')
+        seconds = int(num) / int(denom) if slash else float(body)
+        return cls(frames=int(seconds * frame_rate), frame_rate=frame_rate)
 
     def to_rational(self) -> str:
         """Convert to FCPXML rational format."""
@@ -503,7 +542,7 @@ class Timecode:
 # CORE MODELS
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Keyword:
     """Represents a keyword/tag applied to a clip."""
     value: str
@@ -511,7 +550,7 @@ class Keyword:
     duration: Optional[Timecode] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Marker:
     """Represents a marker in the timeline."""
     name: str
@@ -532,7 +571,7 @@ class Marker:
         return f"{minutes}:{secs:02d}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Clip:
     """Represents a clip in the timeline."""
     name: str
@@ -573,7 +612,7 @@ class Clip:
         return [k.value for k in self.keywords]
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioClip(Clip):
     """Audio-specific clip."""
     channels: int = 2
@@ -581,7 +620,7 @@ class AudioClip(Clip):
     role: str = "dialogue"
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoClip(Clip):
     """Video-specific clip."""
     width: int = 1920
@@ -589,7 +628,7 @@ class VideoClip(Clip):
     has_audio: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectedClip:
     """A clip connected to a primary storyline clip (B-roll, titles, audio).
 
@@ -641,7 +680,7 @@ class SilenceCandidate:
     clip_index: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Transition:
     """Represents a transition between clips."""
     name: str
@@ -650,7 +689,7 @@ class Transition:
     transition_type: str = "cross-dissolve"
 
 
-@dataclass
+@dataclass(slots=True)
 class Timeline:
     """Represents a Final Cut Pro timeline/sequence."""
     name: str
@@ -664,6 +703,57 @@ class Timeline:
     markers: List[Marker] = field(default_factory=list)
     connected_clips: List[ConnectedClip] = field(default_factory=list)
     compound_clips: List[CompoundClip] = field(default_factory=list)
+    # Lazily-built lookup structures over ``clips`` (start/duration columns,
+    # keyword index).  Each entry is stamped with the clips list it was built
+    # from and its length, so appends and list replacement rebuild on the
+    # next query.  In-place edits to existing clips need invalidate_indexes().
+    _indexes: Dict[str, Tuple[Any, int, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def _index(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return the cached index *key*, rebuilding it if ``clips`` changed."""
+        cached = self._indexes.get(key)
+        if cached is None or cached[0] is not self.clips or cached[1] != len(self.clips):
+            cached = (self.clips, len(self.clips), build())
+            self._indexes[key] = cached
+        return cached[2]
+
+    def invalidate_indexes(self) -> None:
+        """Drop cached clip indexes after mutating clips in place."""
+        self._indexes.clear()
+
+    def _build_columns(self) -> Tuple[array, array, bool]:
+        """Clip starts and durations in seconds as packed float columns.
+
+        Built in one walk over ``clips``.  The flag records whether the clips
+        are laid end to end (each start at or after the previous clip's end),
+        which is what lets get_clip_at() bisect the starts column.
+        """
+        starts, durations = array('d'), array('d')
+        contiguous = True
+        prev_end = float('-inf')
+        for clip in self.clips:
+            start, dur = clip.start.seconds, clip.duration_seconds
+            if start < prev_end:
+                contiguous = False
+            starts.append(start)
+            durations.append(dur)
+            prev_end = start + dur
+        return starts, durations, contiguous
+
+    @property
+    def _durations(self) -> array:
+        """Clip durations in seconds, parallel to ``clips``."""
+        return self._index('columns', self._build_columns)[1]
+
+    def _build_keyword_index(self) -> Dict[str, List[Clip]]:
+        """Map each keyword value to the clips tagged with it, in timeline order."""
+        index: Dict[str, List[Clip]] = {}
+        for clip in self.clips:
+            for value in dict.fromkeys(clip.keyword_values):
+                index.setdefault(value, []).append(clip)
+        return index
 
     @property
     def total_clips(self) -> int:
@@ -677,7 +767,12 @@ class Timeline:
     def average_clip_duration(self) -> float:
         if not self.clips:
             return 0.0
-        return sum(c.duration_seconds for c in self.clips) / len(self.clips)
+        return sum(self._durations) / len(self.clips)
+
+    @property
+    def clip_durations(self) -> List[float]:
+        """Clip durations in seconds, in timeline order (a fresh list)."""
+        return self._durations.tolist()
 
     @property
     def cuts_per_minute(self) -> float:
@@ -688,14 +783,21 @@ class Timeline:
 
     def get_clips_shorter_than(self, seconds: float) -> List[Clip]:
         """Find clips shorter than threshold (flash frame detection)."""
-        return [c for c in self.clips if c.duration_seconds < seconds]
+        return [c for c, d in zip(self.clips, self._durations) if d < seconds]
 
     def get_clips_longer_than(self, seconds: float) -> List[Clip]:
         """Find clips longer than threshold."""
-        return [c for c in self.clips if c.duration_seconds > seconds]
+        return [c for c, d in zip(self.clips, self._durations) if d > seconds]
 
     def get_clip_at(self, timecode: float) -> Optional[Clip]:
         """Find the clip at a specific timecode (seconds)."""
+        starts, _, contiguous = self._index('columns', self._build_columns)
+        if contiguous:
+            i = bisect_right(starts, timecode) - 1
+            if i < 0:
+                return None
+            clip = self.clips[i]
+            return clip if timecode < clip.end.seconds else None
         for clip in self.clips:
             start_sec = clip.start.seconds
             end_sec = clip.end.seconds
@@ -705,7 +807,7 @@ class Timeline:
 
     def get_clips_by_keyword(self, keyword: str) -> List[Clip]:
         """Find all clips with a specific keyword."""
-        return [c for c in self.clips if keyword in c.keyword_values]
+        return list(self._index('keywords', self._build_keyword_index).get(keyword, ()))
 
 
 @dataclass
@@ -2,9 +2,12 @@
 FCPXML Parser - Reads Final Cut Pro XML files into Python objects.
 """
 
+import io
+import os
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from .models import (
     MARKER_XML_TAGS,
@@ -19,7 +22,7 @@ from .models import (
     TimeValue,
     Transition,
 )
-from .safe_xml import safe_fromstring, safe_parse
+from .safe_xml import safe_iterparse
 
 # Maximum FCPXML file size (50 MB) — prevents memory exhaustion from crafted files
 _MAX_FILE_SIZE_BYTES = 50 * 1024 * 1024
@@ -27,6 +30,17 @@ _MAX_FILE_SIZE_BYTES = 50 * 1024 * 1024
 # Tags that represent connected clip elements (includes 'title' for text overlays)
 _CONNECTED_CLIP_TAGS = ('asset-clip', 'clip', 'video', 'audio', 'title', 'ref-clip')
 
+# Spine children parsed as primary-storyline clips
+_SPINE_CLIP_TAGS = ('asset-clip', 'clip', 'video', 'mc-clip', 'sync-clip', 'ref-clip')
+
+# Timecodes are immutable, and a document repeats the same handful of
+# rational strings (durations, starts, offsets) across thousands of items,
+# so parsed values are shared rather than rebuilt per attribute.
+_timecode_from_rational = lru_cache(maxsize=16384)(Timecode.from_rational)
+
+# Children of these containers are dropped from the streamed tree once closed
+_RELEASED_PARENT_TAGS = ('library', 'event')
+
 
 class FCPXMLParser:
     """Parser for Final Cut Pro FCPXML files. Supports versions 1.8 - 1.14.
@@ -41,168 +55,255 @@ class FCPXMLParser:
         self.resources: Dict[str, Dict[str, Any]] = {}
         self.formats: Dict[str, Dict[str, Any]] = {}
         self.frame_rate: float = 24.0
-
-    def _tc(self, elem: ET.Element, attr: str, default: str = '0s') -> Timecode:
-        """Parse a rational time attribute from an XML element.
-
-        Centralises the ``Timecode.from_rational(elem.get(attr), frame_rate)``
-        pattern that repeats across every clip/marker/transition parser.
-        """
-        return Timecode.from_rational(elem.get(attr, default), self.frame_rate)
+        self._library_clips: Optional[List[Dict[str, Any]]] = None
 
     def parse_file(self, filepath: str) -> Project:
         """Parse an FCPXML file and return a Project object.
 
         Enforces a file size limit to prevent memory exhaustion from
-        maliciously large XML files.
+        maliciously large XML files.  The document is streamed: each spine
+        item is parsed as soon as its closing tag is read and then dropped,
+        so peak memory tracks one clip subtree rather than the whole file.
+        """
+        with self._open_checked(filepath) as f:
+            return self._parse_events(safe_iterparse(f))
+
+    def parse_resources(self, filepath: str) -> Dict[str, Dict[str, Any]]:
+        """Parse only the ``<resources>`` section of an FCPXML file.
+
+        For callers that need formats and assets (e.g. get_library_clips())
+        but not timelines: reading stops at the closing ``</resources>``
+        tag, so the library and its spines are never read or parsed.
+
+        Returns:
+            The asset resources dict (also stored on ``self.resources``).
+        """
+        depth = 0
+        with self._open_checked(filepath) as f:
+            for event, elem in safe_iterparse(f):
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 1 and elem.tag == 'resources':
+                    self._parse_resources(elem)
+                    break
+        return self.resources
+
+    def _open_checked(self, filepath: str) -> BinaryIO:
+        """Open an FCPXML file (or ``.fcpxmld`` bundle) within the size limit.
+
+        The size is read from the open handle, so the file that was checked
+        is the one that gets parsed, even if the path is swapped meanwhile.
         """
         path = Path(filepath)
         if path.suffix == '.fcpxmld':
             fcpxml_path = path / 'Info.fcpxml'
             if not fcpxml_path.exists():
                 raise FileNotFoundError(f"Info.fcpxml not found in bundle: {filepath}")
-            filepath = str(fcpxml_path)
-            path = Path(filepath)
-        file_size = path.stat().st_size
+            path = fcpxml_path
+        f = path.open('rb')
+        file_size = os.fstat(f.fileno()).st_size
         if file_size > _MAX_FILE_SIZE_BYTES:
+            f.close()
             raise ValueError(
                 f"FCPXML file exceeds maximum size "
                 f"({file_size / 1024 / 1024:.1f} MB > "
                 f"{_MAX_FILE_SIZE_BYTES / 1024 / 1024:.0f} MB limit)"
             )
-        tree = safe_parse(filepath)
-        return self._parse_fcpxml(tree.getroot())
-
-    def parse_string(self, xml_string: str) -> Project:
-        """Parse FCPXML from a string."""
-        return self._parse_fcpxml(safe_fromstring(xml_string))
-
-    def _parse_fcpxml(self, root: ET.Element) -> Project:
-        """Parse the root fcpxml element."""
-        version = root.get('version', '1.11')
-        resources_elem = root.find('resources')
-        if resources_elem is not None:
-            self._parse_resources(resources_elem)
-
-        timelines = []
-        for library in root.findall('.//library'):
-            for event in library.findall('event'):
-                for project in event.findall('project'):
-                    timeline = self._parse_project(project)
-                    if timeline:
-                        timelines.append(timeline)
-
-        if not timelines:
-            for project in root.findall('.//project'):
-                timeline = self._parse_project(project)
-                if timeline:
-                    timelines.append(timeline)
+        return f
+
+    def parse_string(self, xml_string: Union[str, bytes]) -> Project:
+        """Parse FCPXML from a string.
 
+        Raw ``bytes`` are fed to expat as-is (it honours the XML
+        declaration's encoding), so callers holding file contents need not
+        decode them first.
+        """
+        if isinstance(xml_string, bytes):
+            return self._parse_events(safe_iterparse(io.BytesIO(xml_string)))
+        return self._parse_events(safe_iterparse(io.StringIO(xml_string)))
+
+    def _parse_events(self, events: Iterable[Tuple[str, ET.Element]]) -> Project:
+        """Build a Project from ``('start' | 'end', element)`` parse events.
+
+        Follows the layout the FCPXML DTD guarantees — root ``<resources>``
+        first, then ``library > event > project > sequence > spine`` — and
+        parses each piece at its closing tag:
+
+        - root ``<resources>``: formats and assets (needed by every clip)
+        - spine children: clips, gaps and transitions, in timeline order
+        - ``<sequence>``: sequence-level markers
+        - ``<project>``: the finished Timeline
+
+        Consumed subtrees are detached from their parent, so the partially
+        built tree never holds more than the spine item being parsed.
+        Projects under ``library > event`` win; projects anywhere else are
+        used only when none of those produced a timeline.
+        """
+        version = '1.11'
+        stack: List[ET.Element] = []
+        library_timelines: List[Timeline] = []
+        other_timelines: List[Timeline] = []
+        resources_seen = False
+        project = sequence = spine = None
+        timeline: Optional[Timeline] = None
+        offset = 0
+
+        for event, elem in events:
+            if event == 'start':
+                parent = stack[-1] if stack else None
+                stack.append(elem)
+                if parent is None:
+                    version = elem.get('version', '1.11')
+                elif elem.tag == 'project':
+                    project, sequence, spine, timeline = elem, None, None, None
+                elif parent is project and sequence is None and elem.tag == 'sequence':
+                    sequence = elem
+                    timeline = self._new_timeline(project.get('name', 'Untitled'), elem)
+                    offset = 0
+                elif parent is sequence and spine is None and elem.tag == 'spine':
+                    spine = elem
+                continue
+
+            stack.pop()
+            if not stack:
+                continue
+            parent = stack[-1]
+            if parent is spine:
+                offset = self._parse_spine_item(elem, timeline, offset)
+            elif elem is sequence:
+                timeline.markers.extend(self._collect_markers(elem))
+            elif elem.tag == 'project':
+                if timeline is not None:
+                    in_library = (
+                        parent.tag == 'event' and len(stack) >= 2
+                        and stack[-2].tag == 'library'
+                    )
+                    (library_timelines if in_library else other_timelines).append(timeline)
+                project = sequence = spine = timeline = None
+            elif elem.tag == 'resources' and len(stack) == 1 and not resources_seen:
+                resources_seen = True
+                self._parse_resources(elem)
+            if (parent is spine or elem.tag == 'project' or len(stack) == 1
+                    or parent.tag in _RELEASED_PARENT_TAGS):
+                parent.remove(elem)
+
+        timelines = library_timelines or other_timelines
         project_name = timelines[0].name if timelines else "Untitled"
         return Project(name=project_name, timelines=timelines, fcpxml_version=version)
 
     def _parse_resources(self, resources: ET.Element):
-        """Parse the resources section."""
-        for fmt in resources.findall('format'):
-            fmt_id = fmt.get('id', '')
-            self.formats[fmt_id] = {
-                'id': fmt_id, 'name': fmt.get('name', ''),
-                'width': int(fmt.get('width', 1920)),
-                'height': int(fmt.get('height', 1080)),
-                'frameDuration': fmt.get('frameDuration', '1/24s')
-            }
-            frame_dur = fmt.get('frameDuration', '1/24s')
-            if '/' in frame_dur:
-                parts = frame_dur.rstrip('s').split('/', 1)
-                num, denom = int(parts[0]), int(parts[1])
-                if num <= 0:
-                    raise ValueError(f"Invalid frameDuration numerator: {frame_dur}")
-                if denom <= 0:
-                    raise ValueError(f"Invalid frameDuration denominator: {frame_dur}")
-                self.frame_rate = denom / num
-
-        for asset in resources.findall('asset'):
-            asset_id = asset.get('id', '')
-            self.resources[asset_id] = {
-                'id': asset_id, 'name': asset.get('name', ''),
-                'src': asset.get('src', '') or (media_rep.get('src', '') if (media_rep := asset.find('media-rep')) is not None else ''),
-                'start': asset.get('start', '0s'),
-                'duration': asset.get('duration', '0s'),
-                'hasVideo': asset.get('hasVideo', '1') == '1',
-                'hasAudio': asset.get('hasAudio', '1') == '1',
-            }
-
-    def _parse_project(self, project: ET.Element) -> Optional[Timeline]:
-        """Parse a project element into a Timeline."""
-        name = project.get('name', 'Untitled')
-        sequence = project.find('sequence')
-        if sequence is None:
-            return None
-
-        format_ref = sequence.get('format', '')
-        fmt = self.formats.get(format_ref, {})
-
-        timeline = Timeline(
+        """Parse the resources section.
+
+        One pass over its children, dispatching on tag; formats and assets
+        are independent, so interleaving them indexes exactly what two
+        separate findall() sweeps would.
+        """
+        self._library_clips = None
+        for elem in resources:
+            tag = elem.tag
+            if tag == 'format':
+                self._parse_format(elem)
+            elif tag == 'asset':
+                self._parse_asset(elem)
+
+    def _parse_format(self, fmt: ET.Element) -> None:
+        """Index a ``<format>``; a rational frameDuration sets the frame rate."""
+        fmt_id = fmt.get('id', '')
+        frame_dur = fmt.get('frameDuration', '1/24s')
+        self.formats[fmt_id] = {
+            'id': fmt_id, 'name': fmt.get('name', ''),
+            'width': int(fmt.get('width', 1920)),
+            'height': int(fmt.get('height', 1080)),
+            'frameDuration': frame_dur
+        }
+        num, slash, denom = frame_dur.rstrip('s').partition('/')
+        if slash:
+            num, denom = int(num), int(denom)
+            if num <= 0:
+                raise ValueError(f"Invalid frameDuration numerator: {frame_dur}")
+            if denom <= 0:
+                raise ValueError(f"Invalid frameDuration denominator: {frame_dur}")
+            self.frame_rate = denom / num
+
+    def _parse_asset(self, asset: ET.Element) -> None:
+        """Index an ``<asset>``, taking src from its media-rep when needed."""
+        asset_id = asset.get('id', '')
+        self.resources[asset_id] = {
+            'id': asset_id, 'name': asset.get('name', ''),
+            'src': asset.get('src', '') or (media_rep.get('src', '') if (media_rep := asset.find('media-rep')) is not None else ''),
+            'start': asset.get('start', '0s'),
+            'duration': asset.get('duration', '0s'),
+            'hasVideo': asset.get('hasVideo', '1') == '1',
+            'hasAudio': asset.get('hasAudio', '1') == '1',
+        }
+
+    def _new_timeline(self, name: str, sequence: ET.Element) -> Timeline:
+        """Create an empty Timeline from a ``<sequence>`` element's attributes."""
+        fmt = self.formats.get(sequence.get('format', ''), {})
+        return Timeline(
             name=name,
-            duration=self._tc(sequence, 'duration'),
+            duration=_timecode_from_rational(sequence.get('duration', '0s'), self.frame_rate),
             frame_rate=self.frame_rate,
             width=fmt.get('width', 1920),
             height=fmt.get('height', 1080)
         )
 
-        spine = sequence.find('spine')
-        if spine is not None:
-            self._parse_spine(spine, timeline)
-
-        timeline.markers.extend(self._collect_markers(sequence))
+    def _parse_spine_item(self, elem: ET.Element, timeline: Timeline,
+                          current_offset: int) -> int:
+        """Parse one spine child into *timeline*; return the next offset in frames.
 
-        return timeline
-
-    def _parse_spine(self, spine: ET.Element, timeline: Timeline):
-        """Parse the spine (primary storyline) including connected clips."""
-        current_offset = 0
-        for elem in spine:
-            tag = elem.tag
-            if tag in ('asset-clip', 'clip', 'video', 'mc-clip', 'sync-clip', 'ref-clip'):
-                clip = self._parse_clip(elem, current_offset)
-                if clip:
-                    timeline.clips.append(clip)
-                    self._parse_connected_clips(elem, clip, timeline)
-                    current_offset += clip.duration.frames
-            elif tag == 'gap':
-                gap_frames = self._tc(elem, 'duration').frames
-                self._parse_gap_connected_clips(elem, current_offset, timeline)
-                current_offset += gap_frames
-            elif tag == 'transition':
-                transition = self._parse_transition(elem, current_offset)
-                if transition:
-                    timeline.transitions.append(transition)
+        Dispatches on the element tag through ``_SPINE_HANDLERS``; tags
+        without a handler (titles on the spine, unknown future elements)
+        leave the offset unchanged.
+        """
+        handler = self._SPINE_HANDLERS.get(elem.tag)
+        if handler is None:
+            return current_offset
+        return handler(self, elem, timeline, current_offset)
+
+    def _spine_clip(self, elem: ET.Element, timeline: Timeline, offset: int) -> int:
+        clip = self._parse_clip(elem, offset)
+        if clip:
+            timeline.clips.append(clip)
+            timeline.connected_clips.extend(clip.connected_clips)
+            offset += clip.duration.frames
+        return offset
+
+    def _spine_gap(self, elem: ET.Element, timeline: Timeline, offset: int) -> int:
+        gap_frames = _timecode_from_rational(elem.get('duration', '0s'), self.frame_rate).frames
+        self._parse_gap_connected_clips(elem, offset, timeline)
+        return offset + gap_frames
+
+    def _spine_transition(self, elem: ET.Element, timeline: Timeline, offset: int) -> int:
+        transition = self._parse_transition(elem, offset)
+        if transition:
+            timeline.transitions.append(transition)
+        return offset
+
+    _SPINE_HANDLERS: Dict[str, Callable[..., int]] = {
+        **dict.fromkeys(_SPINE_CLIP_TAGS, _spine_clip),
+        'gap': _spine_gap,
+        'transition': _spine_transition,
+    }
 
     def _parse_clip(self, elem: ET.Element, offset: int) -> Optional[Clip]:
         """Parse a clip element."""
-        name = elem.get('name', 'Untitled Clip')
-        duration = self._tc(elem, 'duration')
-        source_start = self._tc(elem, 'start')
-        ref = elem.get('ref', '')
-        media_path = self.resources.get(ref, {}).get('src', '')
-
+        get, fps = elem.get, self.frame_rate
+        ref = get('ref', '')
         clip = Clip(
-            name=name,
-            start=Timecode(frames=offset, frame_rate=self.frame_rate),
-            duration=duration,
-            source_start=source_start,
-            media_path=media_path,
-            audio_role=elem.get('audioRole', ''),
-            video_role=elem.get('videoRole', ''),
+            name=get('name', 'Untitled Clip'),
+            start=Timecode(frames=offset, frame_rate=fps),
+            duration=_timecode_from_rational(get('duration', '0s'), fps),
+            source_start=_timecode_from_rational(get('start', '0s'), fps),
+            media_path=self.resources.get(ref, {}).get('src', ''),
+            audio_role=get('audioRole', ''),
+            video_role=get('videoRole', ''),
         )
 
-        clip.markers.extend(self._collect_markers(elem))
-
-        for keyword_elem in elem.findall('keyword'):
-            keyword = self._parse_keyword(keyword_elem)
-            if keyword:
-                clip.keywords.append(keyword)
-
+        self._collect_annotations(elem, clip.markers, clip.keywords,
+                                  clip.connected_clips, clip.name)
         return clip
 
     def _parse_marker_element(self, elem: ET.Element) -> Optional[Marker]:
@@ -212,12 +313,13 @@ class FCPXMLParser:
         owns the completed-attribute semantics. This means the parser
         doesn't need separate methods for each tag.
         """
+        get, fps = elem.get, self.frame_rate
         return Marker(
-            name=elem.get('value', ''),
-            start=self._tc(elem, 'start'),
-            duration=self._tc(elem, 'duration', '1/24s'),
+            name=get('value', ''),
+            start=_timecode_from_rational(get('start', '0s'), fps),
+            duration=_timecode_from_rational(get('duration', '1/24s'), fps),
             marker_type=MarkerType.from_xml_element(elem),
-            note=elem.get('note', '')
+            note=get('note', '')
         )
 
     def _collect_markers(self, elem: ET.Element) -> list:
@@ -234,19 +336,43 @@ class FCPXMLParser:
             if marker is not None
         ]
 
+    def _collect_annotations(self, elem: ET.Element, markers: list, keywords: list,
+                             connected: Optional[list] = None, parent_name: str = ''):
+        """Append a clip element's markers, keywords and connected clips in one child pass.
+
+        Everything hanging off a clip comes out of the same walk over its
+        children rather than separate marker, ``findall('keyword')`` and
+        connected-clip passes.  Connected clips are only collected when a
+        *connected* list is given.
+        """
+        for child in elem:
+            tag = child.tag
+            if tag in MARKER_XML_TAGS:
+                marker = self._parse_marker_element(child)
+                if marker is not None:
+                    markers.append(marker)
+            elif tag == 'keyword':
+                keyword = self._parse_keyword(child)
+                if keyword:
+                    keywords.append(keyword)
+            elif connected is not None:
+                connected.extend(self._connected_from_child(child, parent_name))
+
     def _parse_keyword(self, elem: ET.Element) -> Optional[Keyword]:
         """Parse a keyword element."""
+        get, fps = elem.get, self.frame_rate
+        start, duration = get('start'), get('duration')
         return Keyword(
-            value=elem.get('value', ''),
-            start=self._tc(elem, 'start') if elem.get('start') else None,
-            duration=self._tc(elem, 'duration') if elem.get('duration') else None,
+            value=get('value', ''),
+            start=_timecode_from_rational(start, fps) if start else None,
+            duration=_timecode_from_rational(duration, fps) if duration else None,
         )
 
     def _parse_transition(self, elem: ET.Element, offset: int) -> Optional[Transition]:
         """Parse a transition element."""
         return Transition(
             name=elem.get('name', 'Cross Dissolve'),
-            duration=self._tc(elem, 'duration', '1s'),
+            duration=_timecode_from_rational(elem.get('duration', '1s'), self.frame_rate),
             start=Timecode(frames=offset, frame_rate=self.frame_rate)
         )
 
@@ -259,61 +385,54 @@ class FCPXMLParser:
 
         Returns:
             List of dicts with asset metadata: name, asset_id, duration_seconds, src
+
+        The metadata is built once per parsed resources section; each call
+        returns fresh copies so callers may mutate them.
         """
-        result = []
-        for asset_id, asset_data in self.resources.items():
-            # Parse duration to seconds
-            duration_str = asset_data.get('duration', '0s')
-            duration_seconds = self._parse_duration_to_seconds(duration_str)
-
-            clip_info = {
-                'asset_id': asset_id,
-                'name': asset_data.get('name', ''),
-                'duration_seconds': duration_seconds,
-                'src': asset_data.get('src', ''),
-                'has_video': asset_data.get('hasVideo', True),
-                'has_audio': asset_data.get('hasAudio', True),
-            }
-            result.append(clip_info)
-
-        # Filter by keywords if provided
+        # Assets don't carry keywords — in real FCPXML, keywords are on
+        # clips in events — so any keyword filter matches nothing.
         if keywords:
-            # For now, assets don't have keywords directly - return empty if filtering
-            # In real FCPXML, keywords are typically on clips in events, not assets
             return []
-
-        return result
+        if self._library_clips is None:
+            self._library_clips = [
+                {
+                    'asset_id': asset_id,
+                    'name': asset_data.get('name', ''),
+                    'duration_seconds': self._parse_duration_to_seconds(
+                        asset_data.get('duration', '0s')),
+                    'src': asset_data.get('src', ''),
+                    'has_video': asset_data.get('hasVideo', True),
+                    'has_audio': asset_data.get('hasAudio', True),
+                }
+                for asset_id, asset_data in self.resources.items()
+            ]
+        return [dict(info) for info in self._library_clips]
 
     def _iter_connected_elements(self, parent_elem: ET.Element, parent_name: str):
-        """Yield ``(element, lane, parent_name)`` tuples for connected clips.
+        """Yield parsed :class:`ConnectedClip` objects hanging off *parent_elem*."""
+        for child in parent_elem:
+            yield from self._connected_from_child(child, parent_name)
 
-        Shared iteration logic for both spine-clip and gap-attached connected
-        clips — walks direct children with a ``lane`` attribute and
-        ``<storyline>`` wrappers, yielding parsed :class:`ConnectedClip`
-        objects without prescribing where they get stored.
+    def _connected_from_child(self, child: ET.Element, parent_name: str):
+        """Yield the connected clips one child element contributes.
+
+        A child with a ``lane`` attribute is itself a connected clip; a
+        ``<storyline>`` wrapper contributes its clips on the storyline's
+        lane.  Anything else yields nothing.
         """
-        for child in parent_elem:
-            lane = child.get('lane')
-            if lane is not None and child.tag in _CONNECTED_CLIP_TAGS:
-                connected = self._parse_one_connected_clip(
-                    child, int(lane), parent_name)
-                if connected:
-                    yield connected
-            elif child.tag == 'storyline':
-                lane_val = int(child.get('lane', '1'))
-                for sub_elem in child:
-                    if sub_elem.tag in _CONNECTED_CLIP_TAGS:
-                        connected = self._parse_one_connected_clip(
-                            sub_elem, lane_val, parent_name)
-                        if connected:
-                            yield connected
-
-    def _parse_connected_clips(self, parent_elem: ET.Element,
-                                parent_clip: Clip, timeline: Timeline):
-        """Parse connected clips attached to a primary storyline clip."""
-        for connected in self._iter_connected_elements(parent_elem, parent_clip.name):
-            parent_clip.connected_clips.append(connected)
-            timeline.connected_clips.append(connected)
+        lane = child.get('lane')
+        if lane is not None and child.tag in _CONNECTED_CLIP_TAGS:
+            connected = self._parse_one_connected_clip(child, int(lane), parent_name)
+            if connected:
+                yield connected
+        elif child.tag == 'storyline':
+            lane_val = int(child.get('lane', '1'))
+            for sub_elem in child:
+                if sub_elem.tag in _CONNECTED_CLIP_TAGS:
+                    connected = self._parse_one_connected_clip(
+                        sub_elem, lane_val, parent_name)
+                    if connected:
+                        yield connected
 
     def _parse_gap_connected_clips(self, gap_elem: ET.Element,
                                     gap_offset: int, timeline: Timeline):
@@ -324,36 +443,30 @@ class FCPXMLParser:
     def _parse_one_connected_clip(self, elem: ET.Element, lane: int,
                                    parent_name: str) -> Optional[ConnectedClip]:
         """Parse a single connected clip element."""
-        name = elem.get('name', 'Untitled')
-        duration = self._tc(elem, 'duration')
-        start = self._tc(elem, 'start')
-        offset = self._tc(elem, 'offset')
-        ref = elem.get('ref', '')
-        media_path = self.resources.get(ref, {}).get('src', '')
-        role = elem.get('audioRole', '') or elem.get('videoRole', '')
-
+        get, fps = elem.get, self.frame_rate
+        start = _timecode_from_rational(get('start', '0s'), fps)
+        ref = get('ref', '')
         connected = ConnectedClip(
-            name=name, start=start, duration=duration,
-            lane=lane, offset=offset, source_start=start,
-            media_path=media_path, clip_type=elem.tag, role=role,
+            name=get('name', 'Untitled'), start=start,
+            duration=_timecode_from_rational(get('duration', '0s'), fps),
+            lane=lane, offset=_timecode_from_rational(get('offset', '0s'), fps),
+            source_start=start, media_path=self.resources.get(ref, {}).get('src', ''),
+            clip_type=elem.tag, role=get('audioRole', '') or get('videoRole', ''),
             ref_id=ref, parent_clip_name=parent_name,
         )
 
-        connected.markers.extend(self._collect_markers(elem))
-
-        for keyword_elem in elem.findall('keyword'):
-            keyword = self._parse_keyword(keyword_elem)
-            if keyword:
-                connected.keywords.append(keyword)
-
+        self._collect_annotations(elem, connected.markers, connected.keywords)
         return connected
 
-    def _parse_duration_to_seconds(self, duration_str: str) -> float:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_duration_to_seconds(duration_str: str) -> float:
         """Convert FCPXML duration string to seconds.
 
         Delegates to TimeValue.from_timecode() which handles rational
         format (``"150/30s"``), plain seconds (``"10s"``), timecode
-        (``HH:MM:SS:FF``), and frame counts (``"15f"``).
+        (``HH:MM:SS:FF``), and frame counts (``"15f"``).  Memoized — a
+        library reuses a handful of distinct duration strings.
         """
         try:
             return TimeValue.from_timecode(duration_str).to_seconds()
@@ -5,12 +5,15 @@ The flagship feature: select clips by keywords, set a target duration
 and pacing style, and get a complete rough cut assembled automatically.
 """
 
+import itertools
 import random
+import sys
 import uuid
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .models import (
     MontageConfig,
@@ -22,6 +25,16 @@ from .models import (
 )
 from .writer import _create_asset_element, write_fcpxml
 
+# Source clip element types, in the order _index_clips lists them
+_SOURCE_CLIP_TAGS = ('asset-clip', 'clip', 'video')
+
+# Elements the indexer reads; their children stay attached while streaming
+_INDEXED_TAGS = (*_SOURCE_CLIP_TAGS, 'asset', 'format')
+
+# Sort keys over the clip dicts built at index time
+_by_seconds = itemgetter('seconds')
+_by_favorite = itemgetter('is_favorite')
+
 
 class RoughCutGenerator:
     """
@@ -42,89 +55,108 @@ class RoughCutGenerator:
     """
 
     def __init__(self, source_fcpxml: str):
-        """Load source FCPXML for clip selection."""
+        """Load source FCPXML for clip selection.
+
+        The source is streamed rather than loaded: clips are indexed into
+        plain dicts as their closing tags are read, and only the
+        asset/format elements that generate() copies into the output stay
+        referenced.
+        """
         self.source_path = Path(source_fcpxml)
-        from .safe_xml import safe_parse
-        self.tree = safe_parse(source_fcpxml)
-        self.root = self.tree.getroot()
-        self.fps = self._detect_fps()
-        self._index_clips()
-        self._index_resources()
-
-    def _detect_fps(self) -> float:
-        """Extract frame rate from format resource."""
-        for fmt in self.root.findall('.//format'):
-            frame_dur = fmt.get('frameDuration', '1/30s')
-            if '/' in frame_dur:
-                num, denom = frame_dur.replace('s', '').split('/')
-                return int(denom) / int(num)
-        return 30.0
-
-    def _index_clips(self) -> None:
-        """Index all clips with their metadata."""
+        self.fps = 30.0
         self.clips: List[Dict[str, Any]] = []
+        self.resources: Dict[str, ET.Element] = {}
+        self.formats: Dict[str, ET.Element] = {}
+        self._keyword_cache: Optional[Tuple[list, int, Dict[str, List[int]]]] = None
+        self._index_source(source_fcpxml)
+
+    def _index_source(self, source_fcpxml: str) -> None:
+        """Index formats, assets and clips in one streaming pass.
+
+        Clips are listed by type (all asset-clips, then clips, then video),
+        each in document order.  The frame rate comes from the first
+        format with a rational frameDuration; the FCPXML DTD puts
+        ``<resources>`` before the library, so it is known before any clip
+        closes.  Finished elements are detached from their parent unless
+        that parent still needs its children (a clip reads its keywords,
+        an asset is copied whole), which keeps the partial tree small.
+        """
+        from .safe_xml import safe_iterparse
+        by_type: Dict[str, List[Optional[Dict[str, Any]]]] = {
+            tag: [] for tag in _SOURCE_CLIP_TAGS}
+        stack: List[ET.Element] = []
+        slots: List[Optional[int]] = []
+        fps_found = False
+
+        for event, elem in safe_iterparse(source_fcpxml):
+            tag = elem.tag
+            if event == 'start':
+                stack.append(elem)
+                bucket = by_type.get(tag)
+                # Reserve the clip's place at its start tag so nested clips
+                # keep document order.
+                slots.append(len(bucket) if bucket is not None else None)
+                if bucket is not None:
+                    bucket.append(None)
+                continue
 
-        for clip in self.root.findall('.//asset-clip'):
-            clip_data = self._extract_clip_data(clip, 'asset-clip')
-            if clip_data:
-                self.clips.append(clip_data)
-
-        for clip in self.root.findall('.//clip'):
-            clip_data = self._extract_clip_data(clip, 'clip')
-            if clip_data:
-                self.clips.append(clip_data)
-
-        for video in self.root.findall('.//video'):
-            clip_data = self._extract_clip_data(video, 'video')
-            if clip_data:
-                self.clips.append(clip_data)
+            stack.pop()
+            slot = slots.pop()
+            if slot is not None:
+                by_type[tag][slot] = self._extract_clip_data(elem, tag)
+            elif tag == 'asset':
+                self.resources[elem.get('id', '')] = elem
+            elif tag == 'format':
+                self.formats[elem.get('id', '')] = elem
+                if not fps_found:
+                    fps = self._fps_from_format(elem)
+                    if fps is not None:
+                        self.fps, fps_found = fps, True
+            if stack and stack[-1].tag not in _INDEXED_TAGS:
+                stack[-1].remove(elem)
+
+        for clip_type in _SOURCE_CLIP_TAGS:
+            self.clips.extend(c for c in by_type[clip_type] if c)
+
+    @staticmethod
+    def _fps_from_format(fmt: ET.Element) -> Optional[float]:
+        """Frame rate from a format's rational frameDuration, or None."""
+        frame_dur = fmt.get('frameDuration', '1/30s')
+        if '/' in frame_dur:
+            num, denom = frame_dur.replace('s', '').split('/')
+            return int(denom) / int(num)
+        return None
 
     def _extract_clip_data(self, elem: ET.Element, clip_type: str) -> Optional[Dict[str, Any]]:
         """Extract clip metadata into a dictionary."""
-        name = elem.get('name', 'Untitled')
-        duration_str = elem.get('duration', '0s')
-        start_str = elem.get('start', '0s')
-        ref = elem.get('ref', '')
-
-        duration = TimeValue.from_timecode(duration_str, self.fps)
+        get, fps = elem.get, self.fps
+        duration = TimeValue.from_timecode(get('duration', '0s'), fps)
+        seconds = duration.to_seconds()
 
         # Skip very short clips
-        if duration.to_seconds() < 0.1:
+        if seconds < 0.1:
             return None
 
-        # Extract keywords
-        keywords = []
-        for kw in elem.findall('keyword'):
-            keywords.append(kw.get('value', ''))
+        # Extract keywords, interned: a handful of tags recur across
+        # thousands of clips and can share one string object each
+        keywords = [sys.intern(kw.get('value', '')) for kw in elem.findall('keyword')]
 
-        # Check if favorited
-        is_favorite = elem.get('rating', '') == '1' or elem.get('isFavorite', '') == '1'
-        is_rejected = elem.get('rating', '') == '-1' or elem.get('isRejected', '') == '1'
+        # Check if favorited / rejected (rating="1" / rating="-1")
+        rating = get('rating', '')
 
         return {
-            'element': elem,
-            'name': name,
+            'name': get('name', 'Untitled'),
             'type': clip_type,
-            'ref': ref,
+            'ref': get('ref', ''),
             'duration': duration,
-            'start': TimeValue.from_timecode(start_str, self.fps),
+            'seconds': seconds,  # duration as float, the selectors' sort key
+            'start': TimeValue.from_timecode(get('start', '0s'), fps),
             'keywords': keywords,
-            'is_favorite': is_favorite,
-            'is_rejected': is_rejected,
+            'is_favorite': rating == '1' or get('isFavorite', '') == '1',
+            'is_rejected': rating == '-1' or get('isRejected', '') == '1',
             'used': False,  # Track if already used in rough cut
         }
 
-    def _index_resources(self) -> None:
-        """Index all resources (assets, formats)."""
-        self.resources = {}
-        self.formats = {}
-
-        for asset in self.root.findall('.//asset'):
-            self.resources[asset.get('id', '')] = asset
-
-        for fmt in self.root.findall('.//format'):
-            self.formats[fmt.get('id', '')] = fmt
-
     def generate(
         self,
         output_path: str,
@@ -198,12 +230,11 @@ class RoughCutGenerator:
         """Parse various duration formats."""
         # Handle shorthand like "3m30s" or "2m"
         if 'm' in duration and ':' not in duration:
-            parts = duration.lower().replace('s', '').split('m')
-            minutes = int(parts[0]) if parts[0] else 0
-            seconds = float(parts[1]) if len(parts) > 1 and parts[1] else 0
-            total_seconds = minutes * 60 + seconds
+            minutes, _, seconds = duration.lower().replace('s', '').partition('m')
+            total_seconds = (int(minutes) if minutes else 0) * 60 + (float(seconds) if seconds else 0)
             return TimeValue.from_seconds(total_seconds, self.fps)
 
+        # Timecode, rational and plain-seconds forms go through the memoized parser
         return TimeValue.from_timecode(duration, self.fps)
 
     def _filter_clips(
@@ -212,10 +243,24 @@ class RoughCutGenerator:
         exclude_rejected: bool = True,
         favorites_only: bool = False
     ) -> List[Dict[str, Any]]:
-        """Filter clips by criteria."""
-        result = []
+        """Filter clips by criteria.
+
+        A keyword filter matches clips carrying any of *keywords*
+        (case-insensitive) and is answered from the inverted keyword
+        index, so only matching clips are visited.  Results keep the
+        order of ``self.clips``.
+        """
+        if keywords:
+            index = self._keyword_positions()
+            positions = sorted({
+                i for kw in {k.lower() for k in keywords} for i in index.get(kw, ())
+            })
+            candidates = [self.clips[i] for i in positions]
+        else:
+            candidates = self.clips
 
-        for clip in self.clips:
+        result = []
+        for clip in candidates:
             # Skip rejected
             if exclude_rejected and clip['is_rejected']:
                 continue
@@ -224,17 +269,25 @@ class RoughCutGenerator:
             if favorites_only and not clip['is_favorite']:
                 continue
 
-            # Filter by keywords
-            if keywords:
-                clip_kws = set(k.lower() for k in clip['keywords'])
-                filter_kws = set(k.lower() for k in keywords)
-                if not clip_kws & filter_kws:
-                    continue
-
             result.append(clip)
 
         return result
 
+    def _keyword_positions(self) -> Dict[str, List[int]]:
+        """Lowercased keyword → positions in ``self.clips`` carrying it.
+
+        Built on first use and rebuilt if ``clips`` is replaced or resized,
+        mirroring Timeline's derived-index stamp.
+        """
+        cached = self._keyword_cache
+        if cached is None or cached[0] is not self.clips or cached[1] != len(self.clips):
+            index: Dict[str, List[int]] = {}
+            for i, clip in enumerate(self.clips):
+                for kw in {k.lower() for k in clip['keywords']}:
+                    index.setdefault(kw, []).append(i)
+            cached = self._keyword_cache = (self.clips, len(self.clips), index)
+        return cached[2]
+
     def _select_clips_simple(
         self,
         clips: List[Dict[str, Any]],
@@ -244,28 +297,34 @@ class RoughCutGenerator:
     ) -> List[Dict[str, Any]]:
         """Select clips to fill target duration."""
         selected = []
-        current_duration = TimeValue.zero()
+        # Running total kept as whole frames at the generator's timebase:
+        # every selection is built by from_seconds(..., self.fps), so each
+        # step is an int add rather than a TimeValue add plus two divisions.
+        fps_int = int(self.fps)
+        current_frames = 0
         target_seconds = target_duration.to_seconds()
         min_clip, max_clip = pacing.get_duration_range()
 
-        # Sort clips by priority
-        if priority == 'favorites':
-            clips = sorted(clips, key=lambda c: (not c['is_favorite'], -c['duration'].to_seconds()))
-        elif priority == 'longest':
-            clips = sorted(clips, key=lambda c: -c['duration'].to_seconds())
+        # Sort clips by priority (sorts are stable, reverse=True included)
+        if priority == 'longest':
+            clips = sorted(clips, key=_by_seconds, reverse=True)
         elif priority == 'shortest':
-            clips = sorted(clips, key=lambda c: c['duration'].to_seconds())
+            clips = sorted(clips, key=_by_seconds)
         elif priority == 'random':
             random.shuffle(clips)
-        else:  # 'best' - mix of favorites first, then by duration
-            clips = sorted(clips, key=lambda c: (not c['is_favorite'], -c['duration'].to_seconds()))
+        else:  # 'favorites' / 'best' - favorites first, then longest first
+            # Two stable single-key passes order like the (not favorite,
+            # -seconds) tuple key, without building a tuple per clip.
+            clips = sorted(clips, key=_by_seconds, reverse=True)
+            clips.sort(key=_by_favorite, reverse=True)
 
         for clip in clips:
-            if current_duration.to_seconds() >= target_seconds:
+            current_seconds = current_frames / fps_int
+            if current_seconds >= target_seconds:
                 break
 
-            remaining = target_seconds - current_duration.to_seconds()
-            clip_dur = clip['duration'].to_seconds()
+            remaining = target_seconds - current_seconds
+            clip_dur = clip['seconds']
 
             # Calculate usable duration for this clip
             if clip_dur > max_clip:
@@ -279,14 +338,13 @@ class RoughCutGenerator:
                 continue
 
             # Create selection with in/out points
-            selection = {
-                **clip,
-                'use_duration': TimeValue.from_seconds(use_duration, self.fps),
-                'in_point': clip['start'],
-                'out_point': clip['start'] + TimeValue.from_seconds(use_duration, self.fps),
-            }
+            use_tv = TimeValue.from_seconds(use_duration, self.fps)
+            selection = dict(clip)
+            selection['use_duration'] = use_tv
+            selection['in_point'] = clip['start']
+            selection['out_point'] = clip['start'] + use_tv
             selected.append(selection)
-            current_duration = current_duration + TimeValue.from_seconds(use_duration, self.fps)
+            current_frames += use_tv.numerator
 
         return selected
 
@@ -297,7 +355,11 @@ class RoughCutGenerator:
         target_duration: TimeValue,
         pacing: PacingConfig
     ) -> List[Dict[str, Any]]:
-        """Select clips organized by segment structure."""
+        """Select clips organized by segment structure.
+
+        *clips* are entries of ``self.clips`` (as _filter_clips returns
+        them); segment keywords are matched through the inverted index.
+        """
         selected = []
 
         # Calculate duration per segment
@@ -310,14 +372,18 @@ class RoughCutGenerator:
         else:
             per_segment = 0
 
+        keyword_index = self._keyword_positions()
         for segment in segments:
             seg_duration = segment.duration_seconds if segment.duration_seconds > 0 else per_segment
 
-            # Filter clips for this segment
+            # Filter clips for this segment via the inverted keyword index
             if segment.keywords:
-                seg_clips = [c for c in clips if
-                    set(k.lower() for k in c['keywords']) &
-                    set(k.lower() for k in segment.keywords)]
+                matching = {
+                    id(self.clips[i])
+                    for kw in {k.lower() for k in segment.keywords}
+                    for i in keyword_index.get(kw, ())
+                }
+                seg_clips = [c for c in clips if id(c) in matching]
             else:
                 seg_clips = clips.copy()
 
@@ -393,23 +459,19 @@ class RoughCutGenerator:
             name="Rough Cut", uid=str(uuid.uuid4()).upper(),
             modDate=datetime.now().strftime("%Y-%m-%d %H:%M:%S -0500"))
 
-        # Calculate total duration
-        total_duration = TimeValue.zero()
-        for clip in clips:
-            total_duration = total_duration + clip['use_duration']
-
-        # Create sequence
+        # Create sequence; its duration is filled in once the spine is laid out
         sequence = ET.SubElement(project, 'sequence',
             format=format_id or "r1",
-            duration=total_duration.to_fcpxml(),
+            duration="0s",
             tcStart="0s", tcFormat="NDF",
             audioLayout="stereo", audioRate="48k")
 
         spine = ET.SubElement(sequence, 'spine')
 
-        # Add clips to spine
+        # Add clips to spine — the running offset ends as the total duration
         current_offset = TimeValue.zero()
         trans_dur = TimeValue.from_timecode(transition_duration, self.fps) if add_transitions else None
+        half_trans = trans_dur * 0.5 if trans_dur else None
 
         for i, clip in enumerate(clips):
             ET.SubElement(spine, 'asset-clip',
@@ -423,7 +485,6 @@ class RoughCutGenerator:
 
             # Add transition before clip (except first)
             if add_transitions and i > 0 and trans_dur:
-                half_trans = trans_dur * 0.5
                 trans_offset = current_offset - half_trans
 
                 transition = ET.Element('transition',
@@ -436,10 +497,12 @@ class RoughCutGenerator:
 
             current_offset = current_offset + clip['use_duration']
 
+        sequence.set('duration', current_offset.to_fcpxml())
+
         # Write output
         write_fcpxml(root, output_path)
 
-        return total_duration.to_seconds()
+        return current_offset.to_seconds()
 
     # ========================================================================
     # MONTAGE GENERATION (v0.3.0)
@@ -548,7 +611,7 @@ class RoughCutGenerator:
 
             # Find best matching clip
             clip = available[clip_index]
-            clip_dur = clip['duration'].to_seconds()
+            clip_dur = clip['seconds']
 
             # Determine actual duration to use
             remaining = target - current_duration
@@ -560,11 +623,12 @@ class RoughCutGenerator:
                 continue
 
             # Create selection
+            use_tv = TimeValue.from_seconds(use_duration, self.fps)
             selection = {
                 **clip,
-                'use_duration': TimeValue.from_seconds(use_duration, self.fps),
+                'use_duration': use_tv,
                 'in_point': clip['start'],
-                'out_point': clip['start'] + TimeValue.from_seconds(use_duration, self.fps),
+                'out_point': clip['start'] + use_tv,
                 'montage_position': position
             }
             selected.append(selection)
@@ -659,58 +723,35 @@ class RoughCutGenerator:
     ) -> List[Dict[str, Any]]:
         """Build alternating A/B sequence."""
         selected = []
-        current_duration = TimeValue.zero()
+        # Whole frames at the generator's timebase, as in _select_clips_simple
+        fps_int = int(self.fps)
+        current_frames = 0
         target_seconds = target_duration.to_seconds()
 
-        # Track which clips we've used
-        a_index = 0
-        b_index = 0
-        current_roll = start_with.lower()
-
-        while current_duration.to_seconds() < target_seconds:
-            remaining = target_seconds - current_duration.to_seconds()
-
-            if current_roll == 'a':
-                if a_index >= len(a_clips):
-                    a_index = 0  # Loop if needed
-
-                clip = a_clips[a_index]
-                target_dur = min(a_dur.to_seconds(), remaining)
-                clip_dur = clip['duration'].to_seconds()
-                use_dur = min(target_dur, clip_dur)
-
-                selection = {
-                    **clip,
-                    'use_duration': TimeValue.from_seconds(use_dur, self.fps),
-                    'in_point': clip['start'],
-                    'out_point': clip['start'] + TimeValue.from_seconds(use_dur, self.fps),
-                    'roll_type': 'A'
-                }
-                selected.append(selection)
-                current_duration = current_duration + TimeValue.from_seconds(use_dur, self.fps)
-                a_index += 1
-                current_roll = 'b'
-
-            else:  # B-roll
-                if b_index >= len(b_clips):
-                    b_index = 0  # Loop if needed
-
-                clip = b_clips[b_index]
-                target_dur = min(b_dur.to_seconds(), remaining)
-                clip_dur = clip['duration'].to_seconds()
-                use_dur = min(target_dur, clip_dur)
-
-                selection = {
-                    **clip,
-                    'use_duration': TimeValue.from_seconds(use_dur, self.fps),
-                    'in_point': clip['start'],
-                    'out_point': clip['start'] + TimeValue.from_seconds(use_dur, self.fps),
-                    'roll_type': 'B'
-                }
-                selected.append(selection)
-                current_duration = current_duration + TimeValue.from_seconds(use_dur, self.fps)
-                b_index += 1
-                current_roll = 'a'
+        # Each roll cycles through its clips (looping if needed), caps clips
+        # at its own target length, and hands over to the other roll.
+        rolls = {
+            'a': (itertools.cycle(a_clips), a_dur.to_seconds(), 'A', 'b'),
+            'b': (itertools.cycle(b_clips), b_dur.to_seconds(), 'B', 'a'),
+        }
+        current_roll = 'a' if start_with.lower() == 'a' else 'b'
+
+        while (current_seconds := current_frames / fps_int) < target_seconds:
+            remaining = target_seconds - current_seconds
+            roll_clips, roll_seconds, roll_type, current_roll = rolls[current_roll]
+
+            clip = next(roll_clips)
+            use_dur = min(roll_seconds, remaining, clip['seconds'])
+            use_tv = TimeValue.from_seconds(use_dur, self.fps)
+
+            selected.append({
+                **clip,
+                'use_duration': use_tv,
+                'in_point': clip['start'],
+                'out_point': clip['start'] + use_tv,
+                'roll_type': roll_type
+            })
+            current_frames += use_tv.numerator
 
             # Safety check to prevent infinite loop
             if len(selected) > 1000:
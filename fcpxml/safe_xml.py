@@ -14,15 +14,31 @@ Security note: All flags are set explicitly rather than relying on library
 defaults — this ensures protection survives dependency upgrades that might
 change default behavior.
 
+Parsing wires expat straight into the C-accelerated ``ET.TreeBuilder`` and
+installs defusedxml's rejection semantics as expat handlers (raising the
+same ``EntitiesForbidden`` / ``ExternalReferenceForbidden`` /
+``DTDForbidden`` exceptions).  defusedxml's own ``parse()`` routes every
+start tag through the pure-Python ``XMLParser``; skipping that layer keeps
+element construction in C.  The resulting tree matches
+``defusedxml.ElementTree``: DTD-defaulted attributes are filled in, and
+namespaced names come back in ElementTree's ``{uri}local`` form.
+
 IMPORTANT: Never use stdlib xml.etree.ElementTree.parse() or .fromstring()
 directly in this codebase. Always import from this module instead.
 """
 
+import contextlib
+import copy
+import os
+import stat
+import uuid
 import xml.etree.ElementTree as ET
+from typing import IO, Any, BinaryIO, Callable, Dict, Iterator, List, Tuple, Union
 from xml.dom.minidom import Document
+from xml.parsers import expat
 
-import defusedxml.ElementTree as _safe_ET
 import defusedxml.minidom as _safe_minidom
+from defusedxml import DTDForbidden, EntitiesForbidden, ExternalReferenceForbidden
 
 # Explicit security flags — pinned so a defusedxml upgrade that changes
 # defaults cannot silently weaken the boundary.
@@ -38,35 +54,174 @@ _SECURITY_FLAGS = {
 }
 
 
-def safe_parse(source: str) -> ET.ElementTree:
+def _forbid_dtd(name, sysid, pubid, has_internal_subset):
+    raise DTDForbidden(name, sysid, pubid)
+
+
+def _forbid_entity_decl(name, is_parameter_entity, value, base, sysid, pubid, notation_name):
+    raise EntitiesForbidden(name, value, base, sysid, pubid, notation_name)
+
+
+def _forbid_unparsed_entity_decl(name, base, sysid, pubid, notation_name):
+    raise EntitiesForbidden(name, None, base, sysid, pubid, notation_name)
+
+
+def _forbid_external_ref(context, base, sysid, pubid):
+    raise ExternalReferenceForbidden(context, base, sysid, pubid)
+
+
+def _fixname(key: str) -> str:
+    # Expat reports namespaced names as "uri}local"; ElementTree spells them
+    # "{uri}local".
+    return '{' + key if '}' in key else key
+
+
+def _with_qualified_names(
+    start: Callable[[str, Dict[str, str]], Any],
+    end: Callable[[str], Any],
+) -> Tuple[Callable[[str, Dict[str, str]], Any], Callable[[str], Any]]:
+    """Wrap tree-building callbacks so names reach them in ``{uri}local`` form."""
+
+    def qualified_start(tag: str, attrib: Dict[str, str]) -> Any:
+        for key in attrib:
+            if '}' in key:
+                attrib = {_fixname(k): v for k, v in attrib.items()}
+                break
+        return start(_fixname(tag), attrib)
+
+    def qualified_end(tag: str) -> Any:
+        return end(_fixname(tag))
+
+    return qualified_start, qualified_end
+
+
+def _hardened_parser(builder: ET.TreeBuilder) -> Any:
+    """Create an expat parser that feeds *builder* with the forbid handlers set."""
+    parser = expat.ParserCreate(None, '}')
+    parser.buffer_text = True
+    parser.StartElementHandler, parser.EndElementHandler = _with_qualified_names(
+        builder.start, builder.end
+    )
+    parser.CharacterDataHandler = builder.data
+    if _SECURITY_FLAGS["forbid_dtd"]:
+        parser.StartDoctypeDeclHandler = _forbid_dtd
+    if _SECURITY_FLAGS["forbid_entities"]:
+        parser.EntityDeclHandler = _forbid_entity_decl
+        parser.UnparsedEntityDeclHandler = _forbid_unparsed_entity_decl
+    if _SECURITY_FLAGS["forbid_external"]:
+        parser.ExternalEntityRefHandler = _forbid_external_ref
+
+    def reject_undefined_entity(text: str) -> None:
+        # Expat hands references it could not resolve (possible once a DTD
+        # is present) to the default handler; ElementTree treats them as
+        # errors rather than silently dropping them.
+        if text[:1] == '&':
+            err = ET.ParseError(
+                f"undefined entity {text}: line {parser.ErrorLineNumber}, "
+                f"column {parser.ErrorColumnNumber}"
+            )
+            err.code = expat.errors.codes[expat.errors.XML_ERROR_UNDEFINED_ENTITY]
+            err.position = (parser.ErrorLineNumber, parser.ErrorColumnNumber)
+            raise err
+
+    parser.DefaultHandlerExpand = reject_undefined_entity
+    return parser
+
+
+@contextlib.contextmanager
+def _expat_errors_as_parse_error() -> Iterator[None]:
+    """Re-raise expat syntax errors as ``ET.ParseError`` like ElementTree does."""
+    try:
+        yield
+    except expat.ExpatError as e:
+        err = ET.ParseError(str(e))
+        err.code = e.code
+        err.position = (e.lineno, e.offset)
+        raise err from None
+
+
+def _build_tree(feed: Callable[[Any], Any]) -> ET.Element:
+    """Run *feed* against a hardened expat parser and return the root Element.
+
+    *feed* receives the configured expat parser and must push the whole
+    document through it (``Parse(text, True)`` or ``ParseFile(f)``).
+    """
+    builder = ET.TreeBuilder()
+    parser = _hardened_parser(builder)
+    with _expat_errors_as_parse_error():
+        feed(parser)
+    return builder.close()
+
+
+def safe_parse(source: Union[str, os.PathLike, BinaryIO]) -> ET.ElementTree:
     """Parse an XML file with XXE and entity-expansion protection.
 
     All DTD processing, entity definitions, and external references are
     rejected outright. Returns a standard ElementTree so downstream code
     is unchanged.
     """
-    return _safe_ET.parse(source, **_SECURITY_FLAGS)
+    if hasattr(source, 'read'):
+        return ET.ElementTree(_build_tree(lambda p: p.ParseFile(source)))
+    with open(source, 'rb') as f:
+        return ET.ElementTree(_build_tree(lambda p: p.ParseFile(f)))
 
 
-def safe_fromstring(text: str) -> ET.Element:
+def safe_fromstring(text: Union[str, bytes]) -> ET.Element:
     """Parse an XML string with XXE and entity-expansion protection.
 
     All DTD processing, entity definitions, and external references are
     rejected outright. Returns a standard Element so downstream code is
     unchanged.
     """
-    return _safe_ET.fromstring(text, **_SECURITY_FLAGS)
+    return _build_tree(lambda p: p.Parse(text, True))
+
+
+# Read size for safe_iterparse — events are handed out after each chunk.
+_ITERPARSE_CHUNK_SIZE = 64 * 1024
+
+
+def safe_iterparse(
+    source: Union[str, os.PathLike, IO],
+) -> Iterator[Tuple[str, ET.Element]]:
+    """Stream ``('start' | 'end', element)`` events with the same protection.
+
+    Streaming counterpart of safe_parse() for callers that process the
+    document as it is read — the ``ET.iterparse`` contract.  Elements are
+    complete (all children and text) at their ``end`` event; the caller
+    may then detach them from their parent to keep memory bounded.
+
+    *source* is a path or a file object opened in binary or text mode.
+    """
+    builder = ET.TreeBuilder()
+    parser = _hardened_parser(builder)
+    events: List[Tuple[str, ET.Element]] = []
+    append = events.append
+
+    def start(tag: str, attrib: Dict[str, str]) -> None:
+        append(('start', builder.start(tag, attrib)))
+
+    def end(tag: str) -> None:
+        append(('end', builder.end(tag)))
+
+    parser.StartElementHandler, parser.EndElementHandler = _with_qualified_names(start, end)
+
+    with contextlib.ExitStack() as stack:
+        f = source if hasattr(source, 'read') else stack.enter_context(open(source, 'rb'))
+        with _expat_errors_as_parse_error():
+            while chunk := f.read(_ITERPARSE_CHUNK_SIZE):
+                parser.Parse(chunk, False)
+                yield from events
+                events.clear()
+            parser.Parse(b'', True)
+        yield from events
+    builder.close()
 
 
 def safe_parse_string(text: str) -> Document:
     """Parse an XML string into a minidom Document with XXE protection.
 
-    Drop-in replacement for xml.dom.minidom.parseString(). Used in the
-    pretty-print path (writer.py, export.py) to maintain defense-in-depth
-    even when re-parsing XML that was already produced by safe_parse().
-
-    Why this matters: if a future refactor passes unsanitized XML through
-    serialize_xml(), stdlib minidom would silently process external
+    Drop-in replacement for xml.dom.minidom.parseString() for any caller
+    that needs a DOM — stdlib minidom would silently process external
     entities and DTD bombs. Using defusedxml.minidom closes that gap.
     """
     return _safe_minidom.parseString(text)
@@ -77,12 +232,14 @@ def serialize_xml(root: ET.Element, filepath: str, doctype: str = "") -> str:
 
     Single serialization pipeline shared by all XML output paths
     (write_fcpxml for FCPXML, DaVinciExporter for XMEML / simplified exports).
-    Consolidates the ET.tostring → minidom → toprettyxml → strip blanks →
-    replace declaration → write-to-file sequence that was previously
-    duplicated across writer.py and export.py.
+    Indents a copy of the tree with ``ET.indent`` and streams it straight to
+    the file behind the XML declaration and optional DOCTYPE — no
+    intermediate string, re-parse, or blank-line cleanup pass.  The file is
+    replaced atomically, so readers see either the old or the new document.
 
     Args:
-        root: The XML root Element to serialize.
+        root: The XML root Element to serialize. It is left untouched, so
+            callers such as FCPXMLModifier can keep editing it after a save.
         filepath: Destination file path.
         doctype: DOCTYPE declaration to insert after the XML declaration.
             Example: ``'<!DOCTYPE fcpxml>'`` or ``'<!DOCTYPE xmeml>'``.
@@ -91,23 +248,28 @@ def serialize_xml(root: ET.Element, filepath: str, doctype: str = "") -> str:
     Returns:
         The filepath written to.
     """
-    xml_str = ET.tostring(root, encoding='unicode')
-    dom = safe_parse_string(xml_str)
-    pretty_xml = dom.toprettyxml(indent="    ")
-    lines = [line for line in pretty_xml.split('\n') if line.strip()]
-    final_xml = '\n'.join(lines)
-
-    if doctype:
-        final_xml = final_xml.replace(
-            '<?xml version="1.0" ?>',
-            f'<?xml version="1.0" encoding="UTF-8"?>\n{doctype}',
-        )
-    else:
-        final_xml = final_xml.replace(
-            '<?xml version="1.0" ?>',
-            '<?xml version="1.0" encoding="UTF-8"?>',
-        )
-
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(final_xml)
+    root = copy.deepcopy(root)
+    ET.indent(root, space="    ")
+    # Write to a sibling temp file and rename over the target so a failed
+    # serialization never leaves a truncated file behind.  os.open with 0o666
+    # keeps the umask-derived mode a plain open() would have produced.  The
+    # target is resolved first so a symlinked path is written through, not
+    # replaced by a regular file.
+    target = os.path.realpath(filepath)
+    directory, name = os.path.split(target)
+    tmp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex[:8]}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            if doctype:
+                f.write(f'{doctype}\n')
+            ET.ElementTree(root).write(f, encoding='unicode')
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(target).st_mode))
+        os.replace(tmp_path, target)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
     return filepath
@@ -105,6 +105,10 @@ CLIP_AND_AUDIO_TAGS = ('clip', 'asset-clip', 'video', 'audio', 'ref-clip')
 SPINE_ELEMENT_TAGS = ('clip', 'asset-clip', 'video', 'audio', 'gap', 'transition', 'ref-clip')
 
 
+# str.translate table deleting C0 control characters other than tab/LF/CR
+_XML_CONTROL_CHARS = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
+
 def _sanitize_xml_value(value: str, max_length: int = _MAX_MARKER_NAME_LENGTH) -> str:
     """Sanitize a string value before writing it into an XML attribute.
 
@@ -113,14 +117,13 @@ def _sanitize_xml_value(value: str, max_length: int = _MAX_MARKER_NAME_LENGTH) -
     """
     if not isinstance(value, str):
         return str(value)
-    # Remove null bytes and non-printable control characters
-    cleaned = ''.join(
-        c for c in value
-        if c in ('\t', '\n', '\r') or ord(c) >= 32
-    )
-    if len(cleaned) > max_length:
-        cleaned = cleaned[:max_length]
-    return cleaned
+    # A printable head holds no control character, so it already is the
+    # result: neither the copy translate() makes nor the scan of characters
+    # past the limit is needed.  Otherwise strip, then cut, in C.
+    head = value[:max_length]
+    if head.isprintable():
+        return head
+    return value.translate(_XML_CONTROL_CHARS)[:max_length]
 
 
 # FCPXML DTD child element ordering for asset-clip / clip elements.
@@ -147,6 +150,8 @@ _ASSET_CLIP_CHILD_ORDER = [
 
 # Build a priority lookup: tag → index for fast comparison
 _CHILD_ORDER_INDEX = {tag: i for i, tag in enumerate(_ASSET_CLIP_CHILD_ORDER)}
+# Priority of tags missing from the DTD order — they sort after everything
+_UNKNOWN_CHILD_PRIORITY = len(_ASSET_CLIP_CHILD_ORDER)
 
 
 def _dtd_insert(parent: ET.Element, child: ET.Element) -> ET.Element:
@@ -157,16 +162,20 @@ def _dtd_insert(parent: ET.Element, child: ET.Element) -> ET.Element:
     required element sequence for asset-clip / clip elements.
 
     Unknown tags are appended at the end.
+
+    The scan runs backwards from the last child: markers, keywords and the
+    like only step over the few trailing elements (filters, metadata), so
+    adding many markers to one clip stays linear overall.  For siblings in
+    DTD order this is the same slot as the first later-ordered sibling.
     """
-    child_priority = _CHILD_ORDER_INDEX.get(child.tag, len(_ASSET_CLIP_CHILD_ORDER))
+    priority_of = _CHILD_ORDER_INDEX.get
+    child_priority = priority_of(child.tag, _UNKNOWN_CHILD_PRIORITY)
 
-    # Find the first existing child whose priority is greater than ours
+    # Step back over every trailing child that must come after ours
     insert_idx = len(parent)
-    for i, existing in enumerate(parent):
-        existing_priority = _CHILD_ORDER_INDEX.get(existing.tag, len(_ASSET_CLIP_CHILD_ORDER))
-        if existing_priority > child_priority:
-            insert_idx = i
-            break
+    while insert_idx and priority_of(parent[insert_idx - 1].tag,
+                                     _UNKNOWN_CHILD_PRIORITY) > child_priority:
+        insert_idx -= 1
 
     parent.insert(insert_idx, child)
     return child
@@ -187,16 +196,15 @@ def build_marker_element(
     workflow).  Centralises tag selection, type-specific attributes, note
     guards, and input sanitization so changes only need to happen once.
     """
-    elem = ET.Element(marker_type.xml_tag)
-    elem.set('start', start)
-    elem.set('duration', duration)
-    elem.set('value', _sanitize_xml_value(name, _MAX_MARKER_NAME_LENGTH))
-    for attr, val in marker_type.xml_attrs.items():
-        elem.set(attr, val)
+    attrib = {
+        'start': start,
+        'duration': duration,
+        'value': _sanitize_xml_value(name, _MAX_MARKER_NAME_LENGTH),
+        **marker_type.xml_attrs,
+    }
     if note and marker_type != MarkerType.CHAPTER:
-        elem.set('note', _sanitize_xml_value(note, _MAX_NOTE_LENGTH))
-    _dtd_insert(parent, elem)
-    return elem
+        attrib['note'] = _sanitize_xml_value(note, _MAX_NOTE_LENGTH)
+    return _dtd_insert(parent, ET.Element(marker_type.xml_tag, attrib))
 
 
 def _create_asset_element(
@@ -407,7 +415,7 @@ def write_fcpxml(
 ) -> str:
     """Format an ElementTree root as pretty-printed FCPXML and write to disk.
 
-    Handles XML declaration, DOCTYPE insertion, and blank-line cleanup
+    Handles validation, the XML declaration and DOCTYPE insertion
     consistently across all FCPXML output paths (modifier, writer, rough cut).
 
     Args:
@@ -803,9 +811,15 @@ class FCPXMLModifier:
             if child.tag in CLIP_TAGS
         ]
 
-    def _find_spine_clip_at_seconds(self, target_seconds: float) -> tuple[ET.Element, float]:
+    def _find_spine_clip_at_seconds(
+        self, target_seconds: float,
+        spans: Optional[List[Tuple[float, float, ET.Element]]] = None,
+    ) -> tuple[ET.Element, float]:
         """Find the spine clip containing *target_seconds* and return it with the relative offset.
 
+        *spans* may be passed in from ``_spine_clip_spans()`` by callers
+        looking up many positions on an unchanged spine.
+
         Returns:
             ``(clip_element, relative_seconds)`` — the clip and the time
             within that clip corresponding to *target_seconds*.
@@ -813,15 +827,33 @@ class FCPXMLModifier:
         Raises:
             ValueError: If no clip spans the requested position.
         """
-        spine = self._get_spine()
-        for child in spine.findall('*'):
+        if spans is None:
+            spans = self._spine_clip_spans()
+        found = self._spine_clip_at(spans, target_seconds)
+        if found is None:
+            raise ValueError(f"No spine clip at position {target_seconds:.3f}s")
+        return found
+
+    def _spine_clip_spans(self) -> List[Tuple[float, float, ET.Element]]:
+        """Return ``(offset, end, clip)`` in seconds for each spine clip, in spine order."""
+        spans = []
+        for child in self._get_spine():
             if child.tag not in CLIP_TAGS:
                 continue
             offset = self._parse_time(child.get('offset', '0s')).to_seconds()
             dur = self._parse_time(child.get('duration', '0s')).to_seconds()
-            if offset <= target_seconds < offset + dur:
-                return child, target_seconds - offset
-        raise ValueError(f"No spine clip at position {target_seconds:.3f}s")
+            spans.append((offset, offset + dur, child))
+        return spans
+
+    @staticmethod
+    def _spine_clip_at(
+        spans: List[Tuple[float, float, ET.Element]], target_seconds: float
+    ) -> Optional[Tuple[ET.Element, float]]:
+        """Return ``(clip, relative_seconds)`` for the first span holding *target_seconds*, else None."""
+        for offset, end, clip in spans:
+            if offset <= target_seconds < end:
+                return clip, target_seconds - offset
+        return None
 
     def _parse_time(self, tc: str) -> TimeValue:
         """Parse a timecode string to TimeValue."""
@@ -1343,12 +1375,24 @@ class FCPXMLModifier:
         avoiding the name-indexed ``self.clips`` dict which silently drops
         duplicate-named clips.
         """
+        return self._add_marker_at_timeline(timecode, name, marker_type, color, note)
+
+    def _add_marker_at_timeline(
+        self,
+        timecode: str,
+        name: str,
+        marker_type: "MarkerType | str",
+        color: Optional[MarkerColor],
+        note: Optional[str],
+        spans: Optional[List[Tuple[float, float, ET.Element]]] = None,
+    ) -> ET.Element:
+        """add_marker_at_timeline() against optionally precomputed spine spans."""
         if isinstance(marker_type, str):
             marker_type = MarkerType.from_string(marker_type)
         time_value = self._parse_time(timecode)
         target_seconds = time_value.to_seconds()
 
-        clip, relative_seconds = self._find_spine_clip_at_seconds(target_seconds)
+        clip, relative_seconds = self._find_spine_clip_at_seconds(target_seconds, spans)
         relative_tc = TimeValue.from_seconds(relative_seconds, self.fps)
 
         return build_marker_element(
@@ -1379,14 +1423,17 @@ class FCPXMLModifier:
         """
         created = []
 
-        # Handle explicit markers
+        # Handle explicit markers.  Markers never move a clip, so the spine
+        # spans are computed once for the whole batch.
+        spans = self._spine_clip_spans() if markers else None
         for m in markers:
-            marker = self.add_marker_at_timeline(
+            marker = self._add_marker_at_timeline(
                 timecode=m['timecode'],
                 name=m['name'],
                 marker_type=MarkerType.from_string(m.get('marker_type', 'standard')),
                 color=MarkerColor[m['color'].upper()] if m.get('color') else None,
-                note=m.get('note')
+                note=m.get('note'),
+                spans=spans,
             )
             created.append(marker)
 
@@ -1408,16 +1455,18 @@ class FCPXMLModifier:
             interval = self._parse_time(auto_at_intervals).to_seconds()
             total_duration = self._timeline_duration().to_seconds()
             if total_duration > 0:
-
+                # Spans are computed once; positions that land in a gap are
+                # skipped with a None check rather than a raised ValueError.
+                spans = self._spine_clip_spans()
                 current = interval
                 count = 1
                 while current < total_duration:
-                    try:
-                        clip, relative = self._find_spine_clip_at_seconds(current)
-                    except ValueError:
+                    found = self._spine_clip_at(spans, current)
+                    if found is None:
                         current += interval
                         count += 1
                         continue
+                    clip, relative = found
                     rel_tv = TimeValue.from_seconds(relative, self.fps)
                     marker = build_marker_element(
                         parent=clip,
@@ -3019,7 +3068,7 @@ class FCPXMLWriter:
 
     def _tc_to_rational(self, tc: Timecode) -> str:
         """Convert a Timecode to FCPXML rational time string (e.g. '48/24s')."""
-        return f"{tc.frames}/{int(tc.frame_rate)}s"
+        return tc.to_rational()
 
     def write_project(self, project: Project, filepath: str):
         """Write a project to an FCPXML file."""
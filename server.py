@@ -13,6 +13,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import stat
 from pathlib import Path
 from typing import Any, Sequence
 
@@ -115,23 +116,26 @@ def _validate_filepath(filepath: str, allowed_extensions: tuple[str, ...] | None
 
     resolved = Path(filepath).resolve()
 
-    if not resolved.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+    # One stat per file answers exists / is-dir / is-file / size together
+    try:
+        st = resolved.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"File not found: {filepath}") from None
 
     # .fcpxmld bundles are directories (a package wrapping Info.fcpxml plus
     # sidecar data files for object tracking / Cinematic mode).  The size
     # check applies to the inner Info.fcpxml, which is what gets parsed.
-    if resolved.is_dir():
+    if stat.S_ISDIR(st.st_mode):
         if resolved.suffix.lower() != '.fcpxmld':
             raise ValueError(f"Not a regular file: {filepath}")
-        inner = resolved / 'Info.fcpxml'
-        if not inner.is_file():
+        try:
+            st = (resolved / 'Info.fcpxml').stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Invalid bundle (no Info.fcpxml): {filepath}")
-        size_target = inner
-    elif not resolved.is_file():
+    elif not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Not a regular file: {filepath}")
-    else:
-        size_target = resolved
 
     if allowed_extensions and resolved.suffix.lower() not in allowed_extensions:
         raise ValueError(
@@ -139,8 +143,8 @@ def _validate_filepath(filepath: str, allowed_extensions: tuple[str, ...] | None
             f"Allowed: {', '.join(allowed_extensions)}"
         )
 
-    if size_target.stat().st_size > MAX_FILE_SIZE:
-        size_mb = size_target.stat().st_size / (1024 * 1024)
+    if st.st_size > MAX_FILE_SIZE:
+        size_mb = st.st_size / (1024 * 1024)
         raise ValueError(f"File too large ({size_mb:.1f} MB). Maximum: {MAX_FILE_SIZE // (1024 * 1024)} MB")
 
     return str(resolved)
@@ -221,10 +225,28 @@ def _validate_directory(directory: str, *, allowed_root: str | None = None) -> s
 # ============================================================================
 
 def find_fcpxml_files(directory: str) -> list[str]:
-    """Find all FCPXML files in a directory."""
-    path = Path(directory)
-    files = list(str(f) for f in path.rglob("*.fcpxml"))
-    files.extend(str(f) for f in path.rglob("*.fcpxmld"))
+    """Find all FCPXML files (and .fcpxmld bundles) under a directory.
+
+    Walks with ``os.scandir`` so each directory costs one listing, with
+    entry types taken from it rather than a stat per entry.  Matches what
+    ``Path.rglob`` found: symlinked directories are not descended into,
+    and unreadable directories are skipped.
+    """
+    files = []
+    pending = [str(Path(directory))]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.fcpxml', '.fcpxmld')):
+                        files.append(entry.path)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            continue
     return sorted(files)
 
 
@@ -302,6 +324,10 @@ def _fmt_suggestions(suggestions: list[str]) -> str:
     return nl.join(f"- {s}" for s in suggestions)
 
 
+# Any character outside the output-suffix whitelist
+_UNSAFE_SUFFIX_CHARS_RE = re.compile(r'[^a-zA-Z0-9._-]')
+
+
 def generate_output_path(input_path: str, suffix: str = "_modified") -> str:
     """Generate output path from input path.
 
@@ -309,7 +335,7 @@ def generate_output_path(input_path: str, suffix: str = "_modified") -> str:
     alphanumeric, hyphen, underscore, and dot characters survive.
     """
     # Strip anything that could inject path separators or traversal sequences
-    clean_suffix = re.sub(r'[^a-zA-Z0-9._-]', '', suffix)
+    clean_suffix = _UNSAFE_SUFFIX_CHARS_RE.sub('', suffix)
     if not clean_suffix:
         clean_suffix = "_modified"
     p = Path(input_path)
@@ -430,6 +456,35 @@ def _setup_generator(
     return filepath, output_path, generator
 
 
+# Pattern applied per transcript line, compiled once instead of going
+# through re's pattern cache on every call.
+_TRANSCRIPT_LINE_RE = re.compile(r'^(\d{1,2}:\d{2}(?::\d{2}){0,2})\s+(.+)$')
+
+
+def _strip_vtt_tags(line: str) -> str:
+    """Remove ``<...>`` cue markup (``<b>``, ``<v Speaker>``, ``<00:01.000>``).
+
+    Same result as ``re.sub(r'<[^>]+>', '', line)`` — an empty ``<>`` is
+    kept — but scanned with ``str.find``: the regex retries every ``<``
+    against the rest of the line, which is quadratic on a line of
+    unclosed ``<`` from a hostile subtitle file.
+    """
+    parts = []
+    pos = search = 0
+    while (lt := line.find('<', search)) >= 0:
+        gt = line.find('>', lt + 1)
+        if gt < 0:
+            break
+        if gt > lt + 1:
+            parts.append(line[pos:lt])
+            pos = gt + 1
+        search = gt + 1
+    if not parts:
+        return line
+    parts.append(line[pos:])
+    return ''.join(parts)
+
+
 def _parse_timestamp_parts(
     parts: list[str], *, frame_rate: float = 24.0
 ) -> float | None:
@@ -497,7 +552,7 @@ def _extract_subtitle_blocks(text: str, *, strip_vtt_tags: bool = False) -> list
                 ts_line = line
             elif ts_line is not None:
                 if strip_vtt_tags:
-                    line = re.sub(r'<[^>]+>', '', line)
+                    line = _strip_vtt_tags(line)
                 cleaned = line.strip()
                 if cleaned:
                     text_lines.append(cleaned)
@@ -536,7 +591,7 @@ def parse_transcript_timestamps(text: str) -> list[dict]:
         line = line.strip()
         if not line:
             continue
-        match = re.match(r'^(\d{1,2}:\d{2}(?::\d{2}){0,2})\s+(.+)$', line)
+        match = _TRANSCRIPT_LINE_RE.match(line)
         if match:
             seconds = _parse_timestamp_parts(match.group(1).split(':'))
             if seconds is not None:
@@ -1782,7 +1837,7 @@ async def handle_list_projects(arguments: dict) -> Sequence[TextContent]:
 
 async def handle_analyze_timeline(arguments: dict) -> Sequence[TextContent]:
     project, tl = _require_timeline(arguments["filepath"])
-    durs = [c.duration_seconds for c in tl.clips]
+    durs = tl.clip_durations
     avg, med, mn, mx = (0, 0, 0, 0) if not durs else (
         sum(durs)/len(durs), sorted(durs)[len(durs)//2], min(durs), max(durs))
     return _text_result(f"""# Timeline Analysis: {tl.name}
@@ -1827,7 +1882,8 @@ async def handle_list_markers(arguments: dict) -> Sequence[TextContent]:
         markers.extend(clip.markers)
     marker_type = arguments.get("marker_type", "all")
     if marker_type != "all":
-        markers = [m for m in markers if m.marker_type == MarkerType.from_string(marker_type)]
+        wanted = MarkerType.from_string(marker_type)
+        markers = [m for m in markers if m.marker_type is wanted]
     markers.sort(key=lambda m: m.start.frames)
     fmt = arguments.get("format", "detailed")
     if fmt == "youtube":
@@ -1898,16 +1954,16 @@ async def handle_analyze_pacing(arguments: dict) -> Sequence[TextContent]:
     project, tl = _require_timeline(arguments["filepath"])
     if not tl.clips:
         return _text_result("No clips to analyze")
-    durs = [c.duration_seconds for c in tl.clips]
+    durs = tl.clip_durations
     avg = sum(durs) / len(durs)
     q_len = len(durs) // 4 or 1
     segments = [durs[i:i+q_len] for i in range(0, len(durs), q_len)][:4]
     seg_avgs = [sum(s)/len(s) if s else 0 for s in segments]
     suggestions = []
-    flash = [c for c in tl.clips if c.duration_seconds < 0.2]
+    flash = tl.get_clips_shorter_than(0.2)
     if flash:
         suggestions.append(f"  {len(flash)} potential flash frames (< 0.2s)")
-    long = [c for c in tl.clips if c.duration_seconds > 30]
+    long = tl.get_clips_longer_than(30)
     if long:
         suggestions.append(f"  {len(long)} long takes (> 30s) - consider trimming")
     if len(seg_avgs) >= 4 and seg_avgs[3] < seg_avgs[0] * 0.7:
@@ -1933,7 +1989,7 @@ async def handle_analyze_pacing(arguments: dict) -> Sequence[TextContent]:
 async def handle_list_library_clips(arguments: dict) -> Sequence[TextContent]:
     filepath = _validate_filepath(arguments["filepath"], ('.fcpxml', '.fcpxmld'))
     parser = FCPXMLParser()
-    parser.parse_file(filepath)
+    parser.parse_resources(filepath)
     keywords = arguments.get("keywords")
     library_clips = parser.get_library_clips(keywords=keywords)
     limit = arguments.get("limit")
@@ -2583,6 +2639,10 @@ Your edits are now synced to the beat!
 
 # ----- SUBTITLE / TRANSCRIPT HANDLERS -----
 
+# Punctuation dropped when keying scene_changes markers by their first words
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+
 async def handle_import_srt_markers(arguments: dict) -> Sequence[TextContent]:
     filepath, output_path = _resolve_io_paths(arguments, "_subtitled")
     srt_path = _validate_filepath(arguments["srt_path"], ('.srt', '.vtt'))
@@ -2619,7 +2679,7 @@ async def handle_import_srt_markers(arguments: dict) -> Sequence[TextContent]:
         seen_texts = set()
         for m in raw_markers:
             # Normalize: lowercase, strip punctuation
-            normalized = re.sub(r'[^\w\s]', '', m['text'].lower()).strip()
+            normalized = _PUNCTUATION_RE.sub('', m['text'].lower()).strip()
             words = normalized.split()[:3]  # First 3 words as key
             key = ' '.join(words)
             if key and key not in seen_texts:
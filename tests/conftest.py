@@ -0,0 +1,126 @@
+"""Shared pytest fixtures.
+
+Also makes ``server`` importable without the MCP SDK: when the real
+``mcp`` package cannot be imported (system Python vs uv venv), lightweight
+stubs are registered before any test module imports server.py.
+"""
+
+import hashlib
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fcpxml.parser import FCPXMLParser
+
+
+def _install_mcp_shim():
+    """Create lightweight fakes for the mcp modules server.py imports."""
+    mcp = types.ModuleType("mcp")
+    mcp_server = types.ModuleType("mcp.server")
+    mcp_server_stdio = types.ModuleType("mcp.server.stdio")
+    mcp_types = types.ModuleType("mcp.types")
+
+    # mcp.server.Server — needs to be callable and return an object with
+    # decorator methods (call_tool, list_resources, etc.)
+    class _FakeServer:
+        def __init__(self, *a, **kw):
+            pass
+
+        # Decorator stubs — return the decorated function unchanged
+        def call_tool(self):
+            return lambda fn: fn
+
+        def list_tools(self):
+            return lambda fn: fn
+
+        def list_resources(self):
+            return lambda fn: fn
+
+        def read_resource(self):
+            return lambda fn: fn
+
+        def list_prompts(self):
+            return lambda fn: fn
+
+        def get_prompt(self):
+            return lambda fn: fn
+
+    mcp_server.Server = _FakeServer
+
+    # mcp.server.stdio — just needs an async context manager
+    class _FakeCtx:
+        def __init__(self, *a):
+            pass
+        async def __aenter__(self):
+            return (MagicMock(), MagicMock())
+        async def __aexit__(self, *a):
+            pass
+
+    mcp_server_stdio.stdio_server = _FakeCtx
+
+    # mcp.types — dataclasses used by server.py
+    class TextContent:
+        def __init__(self, *, type: str, text: str):
+            self.type = type
+            self.text = text
+
+    for name in ("GetPromptResult", "Prompt", "PromptArgument",
+                 "PromptMessage", "Resource", "Tool"):
+        setattr(mcp_types, name, MagicMock)
+    mcp_types.TextContent = TextContent
+
+    # Register in sys.modules
+    sys.modules.setdefault("mcp", mcp)
+    sys.modules.setdefault("mcp.server", mcp_server)
+    sys.modules.setdefault("mcp.server.stdio", mcp_server_stdio)
+    sys.modules.setdefault("mcp.types", mcp_types)
+
+
+# This must run before any test module imports server.py
+try:
+    import mcp.server.stdio  # noqa: F401
+    import mcp.types  # noqa: F401
+except ImportError:
+    _install_mcp_shim()
+
+SAMPLE = Path(__file__).parent.parent / "examples" / "sample.fcpxml"
+
+
+@pytest.fixture(scope="session")
+def sample_bytes():
+    """Raw bytes of ``examples/sample.fcpxml``, read once for the session.
+
+    For fixtures that write their own copy of the sample to disk.
+    """
+    return SAMPLE.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def sample_project():
+    """``examples/sample.fcpxml`` parsed once for the whole session.
+
+    Shared across tests — treat it as read-only.  Tests that mutate the
+    parsed models must parse their own copy.
+    """
+    return FCPXMLParser().parse_file(str(SAMPLE))
+
+
+@pytest.fixture(scope="session")
+def fcpxml_file(tmp_path_factory):
+    """Factory: path of a session-wide file holding the given FCPXML text.
+
+    Files are named by content hash, so each distinct document is written
+    once per session however many tests load it.  Only for read-only
+    sources — tests that modify a file in place need their own copy.
+    """
+    base = tmp_path_factory.mktemp("fcpxml_sources")
+
+    def path_for(xml: str) -> str:
+        path = base / f"{hashlib.sha1(xml.encode()).hexdigest()}.fcpxml"
+        if not path.exists():
+            path.write_text(xml)
+        return str(path)
+    return path_for
@@ -2,7 +2,8 @@
 
 These tests use the DTDs shipped inside the local Final Cut Pro app
 bundle — the only authoritative FCPXML spec (Apple's online docs stopped
-at 1.10).  On machines without FCP (CI runners), the whole module skips.
+at 1.10).  On machines without FCP (CI runners), those tests skip; the
+version sniff tests at the end need neither the DTDs nor xmllint.
 """
 
 import shutil
@@ -10,7 +11,9 @@ from pathlib import Path
 
 import pytest
 
+from fcpxml import safe_xml
 from fcpxml.dtd import (
+    _root_version,
     available_dtd_versions,
     find_apple_dtd,
     validate_against_dtd,
@@ -22,24 +25,27 @@ SAMPLE = Path(__file__).parent.parent / "examples" / "sample.fcpxml"
 
 HAVE_DTDS = bool(available_dtd_versions()) and shutil.which("xmllint")
 
-pytestmark = pytest.mark.skipif(
+needs_apple_dtds = pytest.mark.skipif(
     not HAVE_DTDS,
     reason="Apple FCPXML DTDs not available (Final Cut Pro not installed) "
     "or xmllint missing",
 )
 
 
+@needs_apple_dtds
 def test_dtds_present_through_1_13():
     versions = available_dtd_versions()
     assert "1.11" in versions
     assert "1.13" in versions
 
 
+@needs_apple_dtds
 def test_find_apple_dtd_rejects_garbage():
     assert find_apple_dtd("../../etc/passwd") is None
     assert find_apple_dtd("99.99") is None
 
 
+@needs_apple_dtds
 def test_template_output_is_dtd_valid(tmp_path):
     clips = {
         "main_content": ClipSpec(src="/test/main.mov", name="Main", duration=10.0),
@@ -69,6 +75,7 @@ VALID_113 = (
 )
 
 
+@needs_apple_dtds
 def test_modifier_roundtrip_stays_dtd_valid(tmp_path):
     src = tmp_path / "valid.fcpxml"
     src.write_text(VALID_113)
@@ -84,6 +91,7 @@ def test_modifier_roundtrip_stays_dtd_valid(tmp_path):
     assert ok is True, detail
 
 
+@needs_apple_dtds
 def test_repo_sample_fixture_known_nonconformant():
     """examples/sample.fcpxml predates media-rep and uses sequence-level
     chapter markers — Apple's 1.11 DTD rejects both.  Documented here so
@@ -94,6 +102,7 @@ def test_repo_sample_fixture_known_nonconformant():
     assert "media-rep" in detail or "asset" in detail
 
 
+@needs_apple_dtds
 def test_invalid_xml_fails_dtd(tmp_path):
     bad = tmp_path / "bad.fcpxml"
     bad.write_text(
@@ -105,7 +114,58 @@ def test_invalid_xml_fails_dtd(tmp_path):
     assert detail
 
 
+@needs_apple_dtds
 def test_validate_missing_file_unavailable():
     ok, detail = validate_against_dtd("/nonexistent/file.fcpxml")
     assert ok is None
     assert "not found" in detail.lower()
+
+
+# Version sniffing — pure parsing, no DTDs or xmllint needed
+
+def _write_doc_with_broken_tail(path, root_tag):
+    """*root_tag*, then a comment longer than one read chunk, then junk."""
+    path.write_text(
+        '<?xml version="1.0"?>\n' + root_tag + "<resources/>"
+        + "<!--" + "x" * (2 * safe_xml._ITERPARSE_CHUNK_SIZE) + "-->" + "</broken>"
+    )
+
+
+def test_root_version_stops_at_the_root_tag(tmp_path, monkeypatch):
+    """Only the first chunk is read; the malformed tail is never parsed."""
+    doc = tmp_path / "big.fcpxml"
+    _write_doc_with_broken_tail(doc, '<fcpxml version="1.11">')
+    reads = []
+    real_open = open
+
+    def counting_open(*args, **kwargs):
+        f = real_open(*args, **kwargs)
+        real_read = f.read
+
+        def read(*a):
+            reads.append(real_read(*a))
+            return reads[-1]
+
+        monkeypatch.setattr(f, "read", read, raising=False)
+        return f
+
+    monkeypatch.setattr(safe_xml, "open", counting_open, raising=False)
+    assert _root_version(doc) == "1.11"
+    assert len(reads) == 1
+    assert len(reads[0]) == safe_xml._ITERPARSE_CHUNK_SIZE
+
+
+def test_root_version_defaults_to_1_13(tmp_path):
+    doc = tmp_path / "noversion.fcpxml"
+    _write_doc_with_broken_tail(doc, "<fcpxml>")
+    assert _root_version(doc) == "1.13"
+
+
+def test_validate_uses_sniffed_version(tmp_path, monkeypatch):
+    """With no DTD directory, the message names the version read from the root."""
+    monkeypatch.setenv("FCPXML_DTD_DIR", str(tmp_path))
+    doc = tmp_path / "big.fcpxml"
+    _write_doc_with_broken_tail(doc, '<fcpxml version="1.11">')
+    ok, detail = validate_against_dtd(str(doc))
+    assert ok is None
+    assert "FCPXML 1.11" in detail
@@ -23,8 +23,6 @@ from fcpxml.writer import FCPXMLModifier
 # TEST FIXTURES
 # ============================================================================
 
-SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'examples', 'sample.fcpxml')
-
 CONNECTED_CLIPS_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE fcpxml>
 <fcpxml version="1.11">
@@ -846,23 +844,17 @@ class TestExport:
 
 class TestBackwardCompatibility:
 
-    def test_existing_sample_still_parses(self):
-        parser = FCPXMLParser()
-        project = parser.parse_file(SAMPLE)
-        tl = project.primary_timeline
+    def test_existing_sample_still_parses(self, sample_project):
+        tl = sample_project.primary_timeline
         assert tl is not None
         assert len(tl.clips) > 0
 
-    def test_existing_sample_no_connected_clips(self):
-        parser = FCPXMLParser()
-        project = parser.parse_file(SAMPLE)
-        tl = project.primary_timeline
+    def test_existing_sample_no_connected_clips(self, sample_project):
+        tl = sample_project.primary_timeline
         assert len(tl.connected_clips) == 0
 
-    def test_clip_without_roles_has_empty_strings(self):
-        parser = FCPXMLParser()
-        project = parser.parse_file(SAMPLE)
-        tl = project.primary_timeline
+    def test_clip_without_roles_has_empty_strings(self, sample_project):
+        tl = sample_project.primary_timeline
         for clip in tl.clips:
             assert isinstance(clip.audio_role, str)
             assert isinstance(clip.video_role, str)
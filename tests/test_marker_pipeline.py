@@ -5,7 +5,6 @@ These cover integration seams between models → writer → parser that existed
 without direct test coverage despite each component being individually tested.
 """
 
-import shutil
 import tempfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -19,13 +18,12 @@ from fcpxml.writer import (
     write_fcpxml,
 )
 
-SAMPLE = Path(__file__).parent.parent / "examples" / "sample.fcpxml"
-
 
 @pytest.fixture
-def temp_fcpxml():
+def temp_fcpxml(sample_bytes):
     with tempfile.NamedTemporaryFile(suffix=".fcpxml", delete=False) as f:
-        shutil.copy(SAMPLE, f.name)
+        f.write(sample_bytes)
+        f.flush()
         yield f.name
     Path(f.name).unlink(missing_ok=True)
 
@@ -88,6 +86,20 @@ class TestBuildMarkerElement:
         build_marker_element(parent, MarkerType.STANDARD, "0s", "1/24s", "M")
         assert len(list(parent)) == 1
 
+    def test_attribute_order_is_stable(self):
+        """Attributes serialize in a fixed order so output diffs stay clean."""
+        parent = ET.Element("clip")
+        elem = build_marker_element(
+            parent, MarkerType.INCOMPLETE, "0s", "1/24s", "Fix", note="n"
+        )
+        assert list(elem.attrib) == ["start", "duration", "value", "completed", "note"]
+
+    def test_inserted_before_later_dtd_children(self):
+        parent = ET.Element("clip")
+        ET.SubElement(parent, "audio-channel-source")
+        elem = build_marker_element(parent, MarkerType.STANDARD, "0s", "1/24s", "M")
+        assert parent[0] is elem
+
 
 # ============================================================
 # batch_add_markers — auto_at_cuts
@@ -3,6 +3,8 @@
 Covers the core time math and model properties that underpin all 34 tools.
 """
 
+import dataclasses
+
 import pytest
 
 from fcpxml.models import (
@@ -64,6 +66,25 @@ class TestTimeValueCreation:
         assert TimeValue.from_timecode("00:00:10;15", fps=30.0).to_seconds() == pytest.approx(10.5, abs=0.05)
 
 
+class TestTimeValueImmutability:
+
+    def test_fields_cannot_be_reassigned(self):
+        tv = TimeValue(90, 30)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tv.numerator = 1
+        assert not hasattr(tv, "__dict__")
+
+    def test_negative_denominator_still_normalized(self):
+        tv = TimeValue(1, -2)
+        assert (tv.numerator, tv.denominator) == (-1, 2)
+
+    def test_from_timecode_shares_instances(self):
+        assert TimeValue.from_timecode("120/24s") is TimeValue.from_timecode("120/24s")
+        assert TimeValue.from_timecode("5s", 24.0) is not TimeValue.from_timecode("5s", 30.0)
+        with pytest.raises(ValueError):
+            TimeValue.from_timecode("10/0s")
+
+
 class TestTimeValueConversions:
 
     def test_to_fcpxml(self):
@@ -159,22 +180,71 @@ class TestTimeline:
     def test_cuts_per_minute(self):
         assert self._make([2, 2, 2]).cuts_per_minute == pytest.approx(20.0, abs=0.5)
 
+    def test_clip_durations(self):
+        tl = self._make([2, 4, 0.5])
+        assert tl.clip_durations == pytest.approx([2.0, 4.0, 0.5])
+        tl.clip_durations.append(99.0)
+        assert len(tl.clip_durations) == 3
+
     def test_shorter_than(self):
         assert len(self._make([0.2, 5, 0.3, 2]).get_clips_shorter_than(0.5)) == 2
 
     def test_longer_than(self):
         assert len(self._make([1, 10, 2, 15]).get_clips_longer_than(5)) == 2
 
+    def test_duration_index_rebuilds_after_append(self):
+        tl = self._make([2, 4])
+        assert tl.average_clip_duration == pytest.approx(3.0, abs=0.1)
+        tl.clips.append(Clip(
+            name="late", start=Timecode(frames=144, frame_rate=24.0),
+            duration=Timecode(frames=0, frame_rate=24.0),
+        ))
+        assert tl.average_clip_duration == pytest.approx(2.0, abs=0.1)
+        assert [c.name for c in tl.get_clips_shorter_than(0.5)] == ["late"]
+
+    def test_invalidate_indexes_after_in_place_edit(self):
+        tl = self._make([2, 4])
+        assert tl.get_clips_longer_than(5) == []
+        tl.clips[0].duration = Timecode(frames=240, frame_rate=24.0)
+        tl.invalidate_indexes()
+        assert [c.name for c in tl.get_clips_longer_than(5)] == ["clip_0"]
+
     def test_clip_at(self):
         clip = self._make([2, 3, 1]).get_clip_at(3.5)
         assert clip is not None and clip.name == "clip_1"
         assert self._make([2, 3]).get_clip_at(999) is None
 
+    def test_clip_at_boundaries(self):
+        tl = self._make([2, 3, 1])
+        assert tl.get_clip_at(-1) is None
+        assert tl.get_clip_at(0).name == "clip_0"
+        assert tl.get_clip_at(2.0).name == "clip_1"
+        assert tl.get_clip_at(5.99).name == "clip_2"
+        assert tl.get_clip_at(6.0) is None
+
+    def test_clip_at_overlapping_clips_falls_back_to_scan(self):
+        tl = self._make([2, 3])
+        tl.clips.append(Clip(
+            name="overlap", start=Timecode(frames=24, frame_rate=24.0),
+            duration=Timecode(frames=24, frame_rate=24.0),
+        ))
+        assert tl.get_clip_at(1.5).name == "clip_0"
+
     def test_by_keyword(self):
         tl = self._make([2, 3])
         tl.clips[0].keywords = [Keyword(value="interview")]
         assert len(tl.get_clips_by_keyword("interview")) == 1
 
+    def test_by_keyword_index(self):
+        tl = self._make([2, 3, 1])
+        tl.clips[0].keywords = [Keyword(value="interview"), Keyword(value="interview")]
+        tl.clips[2].keywords = [Keyword(value="interview"), Keyword(value="broll")]
+        assert [c.name for c in tl.get_clips_by_keyword("interview")] == ["clip_0", "clip_2"]
+        assert tl.get_clips_by_keyword("Interview") == []
+        assert tl.get_clips_by_keyword("missing") == []
+        tl.get_clips_by_keyword("broll").clear()
+        assert len(tl.get_clips_by_keyword("broll")) == 1
+
 
 class TestProject:
 
@@ -196,6 +266,14 @@ class TestMarker:
         m = Marker(name="Act", start=Timecode(frames=24 * 3700, frame_rate=24.0))
         assert m.to_youtube_timestamp().count(":") == 2
 
+    def test_markers_and_keywords_are_frozen_slotted(self):
+        m = Marker(name="Ch", start=Timecode(frames=0))
+        kw = Keyword(value="intro")
+        for obj, attr in ((m, "name"), (kw, "value")):
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                setattr(obj, attr, "x")
+            assert not hasattr(obj, "__dict__")
+
 
 class TestTimecode:
     """Test Timecode — the frame-based time representation used by the parser."""
@@ -219,6 +297,25 @@ class TestTimecode:
         tc = Timecode.from_rational("", frame_rate=24.0)
         assert tc.frames == 0
 
+    def test_from_rational_without_suffix(self):
+        assert Timecode.from_rational("48/24", frame_rate=24.0).frames == 48
+
+    @pytest.mark.parametrize("bad", ["1/2/3s", "a/24s", "1/s", "xs"])
+    def test_from_rational_malformed_raises(self, bad):
+        with pytest.raises(ValueError):
+            Timecode.from_rational(bad, frame_rate=24.0)
+
+    def test_from_rational_zero_denominator_raises(self):
+        with pytest.raises(ZeroDivisionError):
+            Timecode.from_rational("1/0s", frame_rate=24.0)
+
+    def test_immutable_and_hashable(self):
+        tc = Timecode(frames=48, frame_rate=24.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tc.frames = 0
+        assert len({tc, Timecode(frames=48, frame_rate=24.0)}) == 1
+        assert not hasattr(tc, "__dict__")
+
     def test_to_smpte_basic(self):
         tc = Timecode(frames=2700, frame_rate=30.0)
         assert tc.to_smpte() == "00:01:30:00"
@@ -255,6 +352,13 @@ class TestTimecode:
 class TestClipProperties:
     """Test Clip computed properties."""
 
+    def test_clip_is_slotted_but_mutable(self):
+        clip = Clip(name="a", start=Timecode(frames=0), duration=Timecode(frames=24))
+        clip.name = "b"
+        assert clip.name == "b"
+        with pytest.raises(AttributeError):
+            clip.extra = 1
+
     def test_end_timecode(self):
         clip = Clip(
             name="test",
@@ -400,6 +504,11 @@ class TestMarkerType:
         with pytest.raises(ValueError, match="Invalid marker type"):
             MarkerType.from_string("nonexistent")
 
+    def test_from_string_roundtrips_every_member_value(self):
+        """The lookup table must cover every canonical value."""
+        for member in MarkerType:
+            assert MarkerType.from_string(member.value) is member
+
     def test_xml_tag_chapter_vs_marker(self):
         assert MarkerType.CHAPTER.xml_tag == "chapter-marker"
         assert MarkerType.INCOMPLETE.xml_tag == "marker"
@@ -570,6 +679,15 @@ class TestTimeValueToFcpxmlEdgeCases:
     def test_zero_is_always_zero_seconds(self):
         assert TimeValue(0, 2400).to_fcpxml() == "0s"
 
+    def test_fallback_keeps_each_original_form(self):
+        """Equal values with non-standard reductions must not share output."""
+        assert TimeValue(8, 3).to_fcpxml() == "8/3s"
+        assert TimeValue(16, 6).to_fcpxml() == "16/6s"
+
+    def test_negative_values(self):
+        assert TimeValue(-48, 24).to_fcpxml() == "-2s"
+        assert TimeValue(-25, 100).to_fcpxml() == "-25/100s"
+
 
 class TestTimeValueArithmeticEdgeCases:
     """Edge cases in TimeValue arithmetic that could produce incorrect frame values."""
@@ -35,32 +35,31 @@ CLIP_A = '<asset-clip ref="r2" offset="0s" name="A" start="0s" duration="120/24s
 # File-based Parsing (existing)
 # ============================================================
 
-def test_parse_sample():
-    project = FCPXMLParser().parse_file(str(SAMPLE))
+def test_parse_sample(sample_project):
+    project = sample_project
     assert project.name == "Music Video Edit"
     assert len(project.timelines) == 1
 
 
-def test_timeline_props():
-    tl = FCPXMLParser().parse_file(str(SAMPLE)).primary_timeline
+def test_timeline_props(sample_project):
+    tl = sample_project.primary_timeline
     assert tl.frame_rate == 24.0
     assert tl.width == 1920
 
 
-def test_clips_parsed():
-    tl = FCPXMLParser().parse_file(str(SAMPLE)).primary_timeline
+def test_clips_parsed(sample_project):
+    tl = sample_project.primary_timeline
     assert len(tl.clips) > 0
     assert tl.clips[0].name == "Interview_A"
 
 
-def test_markers_parsed():
-    tl = FCPXMLParser().parse_file(str(SAMPLE)).primary_timeline
+def test_markers_parsed(sample_project):
+    tl = sample_project.primary_timeline
     assert len([m for m in tl.markers if m.marker_type == MarkerType.CHAPTER]) == 4
 
 
-def test_short_clip_detection():
-    assert len(FCPXMLParser().parse_file(str(SAMPLE)).primary_timeline
-               .get_clips_shorter_than(0.5)) >= 1
+def test_short_clip_detection(sample_project):
+    assert len(sample_project.primary_timeline.get_clips_shorter_than(0.5)) >= 1
 
 
 # ============================================================
@@ -86,6 +85,37 @@ def test_get_library_clips_filter_by_keyword():
     parser = FCPXMLParser()
     parser.parse_file(str(SAMPLE))
     assert len(parser.get_library_clips(keywords=['NonExistent'])) == 0
+    # The filter short-circuits before any asset metadata is built
+    assert parser._library_clips is None
+
+
+def test_parse_resources_matches_full_parse():
+    parser = FCPXMLParser()
+    resources = parser.parse_resources(str(SAMPLE))
+    full = FCPXMLParser()
+    full.parse_file(str(SAMPLE))
+    assert resources == full.resources
+    assert parser.formats == full.formats
+    assert parser.get_library_clips() == full.get_library_clips()
+
+
+def test_parse_resources_stops_before_library(tmp_path):
+    """Malformed XML past the first read chunk after </resources> is never read."""
+    padding = '<!--' + 'x' * 200_000 + '-->'
+    xml = _fcpxml(CLIP_A, ASSET_R2).replace(
+        '</resources>', '</resources>' + padding).replace('</library>', '</library><broken')
+    path = tmp_path / "resources.fcpxml"
+    path.write_text(xml)
+    assert list(FCPXMLParser().parse_resources(str(path))) == ['r2']
+
+
+def test_get_library_clips_returns_copies_and_tracks_reparse():
+    parser = FCPXMLParser()
+    parser.parse_file(str(SAMPLE))
+    parser.get_library_clips()[0]['name'] = 'mutated'
+    assert 'mutated' not in [c['name'] for c in parser.get_library_clips()]
+    parser.parse_string(_fcpxml(CLIP_A, ASSET_R2.replace('id="r2"', 'id="r9"')))
+    assert 'r9' in [c['asset_id'] for c in parser.get_library_clips()]
 
 
 # ============================================================
@@ -107,13 +137,20 @@ def test_parse_string_clip_properties():
     assert clip.media_path == "file:///a.mov"
 
 
-def test_parse_string_matches_file():
-    from_file = FCPXMLParser().parse_file(str(SAMPLE))
+def test_parse_string_matches_file(sample_project):
+    from_file = sample_project
     from_string = FCPXMLParser().parse_string(SAMPLE.read_text())
     assert from_file.name == from_string.name
     assert len(from_file.timelines[0].clips) == len(from_string.timelines[0].clips)
 
 
+def test_parse_string_accepts_bytes(sample_project):
+    from_bytes = FCPXMLParser().parse_string(SAMPLE.read_bytes())
+    assert from_bytes.name == sample_project.name
+    assert [c.name for c in from_bytes.timelines[0].clips] == \
+        [c.name for c in sample_project.timelines[0].clips]
+
+
 def test_parse_string_30fps():
     xml = _fcpxml(
         '<asset-clip ref="r2" offset="0s" name="A" start="0s" duration="300/30s" format="r1"/>',
@@ -132,6 +169,33 @@ def test_parse_string_2997fps():
     assert FCPXMLParser().parse_string(xml).primary_timeline.frame_rate == pytest.approx(29.97, abs=0.01)
 
 
+def test_parse_string_multiple_library_projects():
+    xml = _fcpxml(CLIP_A, ASSET_R2, project_name="One").replace(
+        '</event>',
+        '<project name="Two"><sequence format="r1" duration="240/24s"><spine>'
+        f'{CLIP_A}{CLIP_A}</spine></sequence></project></event>',
+    )
+    project = FCPXMLParser().parse_string(xml)
+    assert [t.name for t in project.timelines] == ["One", "Two"]
+    assert [len(t.clips) for t in project.timelines] == [1, 2]
+    assert project.timelines[1].clips[1].start.seconds == pytest.approx(5.0, abs=0.01)
+
+
+def test_parse_string_project_outside_library():
+    xml = (
+        '<fcpxml version="1.10"><resources>'
+        '<format id="r1" frameDuration="1/24s" width="1280" height="720"/>'
+        f'{ASSET_R2}</resources>'
+        '<project name="Loose"><sequence format="r1" duration="240/24s"><spine>'
+        f'{CLIP_A}</spine></sequence></project></fcpxml>'
+    )
+    project = FCPXMLParser().parse_string(xml)
+    assert project.name == "Loose"
+    assert project.fcpxml_version == "1.10"
+    assert project.primary_timeline.width == 1280
+    assert len(project.primary_timeline.clips) == 1
+
+
 # ============================================================
 # Markers
 # ============================================================
@@ -224,9 +288,9 @@ def test_chapter_marker_ignores_completed_attribute():
     assert m.marker_type == MarkerType.CHAPTER
 
 
-def test_chapter_markers_on_sequence():
+def test_chapter_markers_on_sequence(sample_project):
     # Chapter markers are children of sequence (parsed via findall .//chapter-marker)
-    tl = FCPXMLParser().parse_file(str(SAMPLE)).primary_timeline
+    tl = sample_project.primary_timeline
     chapters = [m for m in tl.markers if m.marker_type == MarkerType.CHAPTER]
     assert len(chapters) == 4
     assert chapters[0].name == "Intro"
@@ -275,6 +339,12 @@ def test_gap_advances_offset():
     assert tl.clips[1].start.frames == 168  # 120 clip + 48 gap
 
 
+def test_repeated_durations_share_timecode():
+    tl = FCPXMLParser().parse_string(_fcpxml(CLIP_A * 3, ASSET_R2)).primary_timeline
+    assert [c.start.frames for c in tl.clips] == [0, 120, 240]
+    assert tl.clips[0].duration is tl.clips[2].duration
+
+
 # ============================================================
 # Error Handling
 # ============================================================
@@ -340,6 +410,14 @@ def test_duration_to_seconds_multiple_slashes():
     assert FCPXMLParser()._parse_duration_to_seconds("10/20/30s") == 0.0
 
 
+def test_duration_to_seconds_shared_across_parsers():
+    """Memoized per string, not per parser instance."""
+    FCPXMLParser._parse_duration_to_seconds.cache_clear()
+    FCPXMLParser()._parse_duration_to_seconds("48/24s")
+    assert FCPXMLParser()._parse_duration_to_seconds("48/24s") == pytest.approx(2.0)
+    assert FCPXMLParser._parse_duration_to_seconds.cache_info().hits == 1
+
+
 def test_parse_fcpxml_convenience():
     project = parse_fcpxml(str(SAMPLE))
     assert project.name == "Music Video Edit"
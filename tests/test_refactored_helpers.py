@@ -11,68 +11,14 @@ the callers never exercise.
 """
 
 import os
-import sys
 import tempfile
-import types
 import xml.etree.ElementTree as ET
-from unittest.mock import MagicMock
 
 import pytest
 
 from fcpxml.safe_xml import serialize_xml
 from fcpxml.writer import FCPXMLModifier
-
-# ---------------------------------------------------------------------------
-# Shim the `mcp` package tree before importing server.py (same as test_server)
-# ---------------------------------------------------------------------------
-_NEEDS_SHIM = "mcp" not in sys.modules or "mcp.server" not in sys.modules
-
-
-def _install_mcp_shim():
-    mcp = types.ModuleType("mcp")
-    mcp_server = types.ModuleType("mcp.server")
-    mcp_server_stdio = types.ModuleType("mcp.server.stdio")
-    mcp_types = types.ModuleType("mcp.types")
-
-    class _FakeServer:
-        def __init__(self, *a, **kw): pass
-        def call_tool(self): return lambda fn: fn
-        def list_tools(self): return lambda fn: fn
-        def list_resources(self): return lambda fn: fn
-        def read_resource(self): return lambda fn: fn
-        def list_prompts(self): return lambda fn: fn
-        def get_prompt(self): return lambda fn: fn
-
-    mcp_server.Server = _FakeServer
-
-    class _FakeCtx:
-        def __init__(self, *a): pass
-        async def __aenter__(self): return (MagicMock(), MagicMock())
-        async def __aexit__(self, *a): pass
-
-    mcp_server_stdio.stdio_server = _FakeCtx
-
-    class TextContent:
-        def __init__(self, *, type: str, text: str):
-            self.type = type
-            self.text = text
-
-    for name in ("GetPromptResult", "Prompt", "PromptArgument",
-                 "PromptMessage", "Resource", "Tool"):
-        setattr(mcp_types, name, MagicMock)
-    mcp_types.TextContent = TextContent
-
-    sys.modules.setdefault("mcp", mcp)
-    sys.modules.setdefault("mcp.server", mcp_server)
-    sys.modules.setdefault("mcp.server.stdio", mcp_server_stdio)
-    sys.modules.setdefault("mcp.types", mcp_types)
-
-
-if _NEEDS_SHIM:
-    _install_mcp_shim()
-
-from server import _format_batch_result, _markdown_table  # noqa: E402, I001
-
+from server import _format_batch_result, _markdown_table
 
 # ---------------------------------------------------------------------------
 # Minimal FCPXML fixtures
@@ -498,6 +444,49 @@ class TestSerializeXml:
         finally:
             os.unlink(path)
 
+    def test_reindents_previously_indented_tree(self):
+        """Whitespace from a parsed, already-indented file is rewritten, not doubled."""
+        root = ET.fromstring("<root>\n  <a>\n      <b/>\n  </a>\n</root>")
+        with tempfile.NamedTemporaryFile(suffix='.xml', delete=False) as f:
+            path = f.name
+        try:
+            serialize_xml(root, path)
+            with open(path) as f:
+                lines = f.read().split('\n')
+            assert lines[1:] == ["<root>", "    <a>", "        <b />", "    </a>", "</root>"]
+        finally:
+            os.unlink(path)
+
+    def test_multiline_attribute_survives_roundtrip(self):
+        root = ET.Element("root")
+        ET.SubElement(root, "marker", note="line one\nline two")
+        with tempfile.NamedTemporaryFile(suffix='.xml', delete=False) as f:
+            path = f.name
+        try:
+            serialize_xml(root, path)
+            assert ET.parse(path).find("marker").get("note") == "line one\nline two"
+        finally:
+            os.unlink(path)
+
+    def test_failed_write_keeps_original_file(self, tmp_path):
+        """Serialization errors must not truncate the target or leak temp files."""
+        path = tmp_path / "keep.xml"
+        path.write_text("<original/>")
+        root = ET.Element("root")
+        root.set("bad", 1)  # ElementTree refuses to serialize non-str attributes
+        with pytest.raises(TypeError):
+            serialize_xml(root, str(path))
+        assert path.read_text() == "<original/>"
+        assert [p.name for p in tmp_path.iterdir()] == ["keep.xml"]
+
+    def test_overwrite_preserves_file_mode(self, tmp_path):
+        path = tmp_path / "mode.xml"
+        path.write_text("<old/>")
+        path.chmod(0o640)
+        serialize_xml(ET.Element("root"), str(path))
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert "<root />" in path.read_text()
+
     def test_strips_blank_lines(self):
         """Output should not contain blank lines (minidom artifact)."""
         root = ET.Element("root")
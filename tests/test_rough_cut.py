@@ -1,13 +1,11 @@
 """Tests for RoughCutGenerator — the flagship rough cut generation feature.
 
-Covers: __init__, _detect_fps, _index_clips, _extract_clip_data, _index_resources,
+Covers: __init__, _index_source, _fps_from_format, _extract_clip_data,
         generate, _parse_duration, _filter_clips, _select_clips_simple,
         _select_clips_by_segments, _build_ab_sequence, _build_output,
         generate_rough_cut, generate_segmented_rough_cut convenience functions.
 """
 
-import shutil
-import tempfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
@@ -20,141 +18,195 @@ from fcpxml.rough_cut import (
     generate_segmented_rough_cut,
 )
 
-SAMPLE = Path(__file__).parent.parent / "examples" / "sample.fcpxml"
 
+@pytest.fixture(scope="session")
+def temp_fcpxml(tmp_path_factory, sample_bytes):
+    """Temp copy of sample.fcpxml, shared by the session.
 
-@pytest.fixture
-def temp_fcpxml():
-    """Create a temp copy of sample.fcpxml for tests."""
-    with tempfile.NamedTemporaryFile(suffix=".fcpxml", delete=False) as f:
-        shutil.copy(SAMPLE, f.name)
-        yield f.name
-    Path(f.name).unlink(missing_ok=True)
+    The generator only ever reads its source, so one copy serves every
+    test; outputs go to the per-test ``temp_output`` path.
+    """
+    path = tmp_path_factory.mktemp("rough_cut") / "sample.fcpxml"
+    path.write_bytes(sample_bytes)
+    return str(path)
 
 
 @pytest.fixture
-def temp_output():
-    """Create a temp file path for output."""
-    with tempfile.NamedTemporaryFile(suffix=".fcpxml", delete=False) as f:
-        yield f.name
-    Path(f.name).unlink(missing_ok=True)
+def temp_output(tmp_path):
+    """Per-test output path for generated FCPXML."""
+    return str(tmp_path / "rough_cut.fcpxml")
+
+
+@pytest.fixture(scope="session")
+def shared_generator(temp_fcpxml):
+    """RoughCutGenerator over the sample, indexed once for the session.
+
+    Only for tests that leave generator state alone: indexing, filtering,
+    duration parsing and the selectors that return fresh dicts.
+    """
+    return RoughCutGenerator(temp_fcpxml)
+
+
+@pytest.fixture(scope="module")
+def ten_second_cut(temp_fcpxml, tmp_path_factory):
+    """Path of one default 10s rough cut of the sample, generated once.
+
+    Read-only: the output-structure tests inspect this file rather than
+    each generating (and re-writing) an identical cut.
+    """
+    path = tmp_path_factory.mktemp("rough_cut_output") / "ten_seconds.fcpxml"
+    RoughCutGenerator(temp_fcpxml).generate(output_path=str(path), target_duration="10s")
+    return str(path)
 
 
 @pytest.fixture
 def generator(temp_fcpxml):
-    """Pre-loaded RoughCutGenerator from sample."""
+    """Pre-loaded RoughCutGenerator from sample.
+
+    Function-scoped on purpose: generate() and the segment selector mark
+    clip dicts as used, and re-indexing the sample costs less than a deep
+    copy would.
+    """
     return RoughCutGenerator(temp_fcpxml)
 
 
+def _source_xml(spine, format_attrs='frameDuration="1/24s"'):
+    """Minimal single-project FCPXML wrapping *spine* clip elements."""
+    return f"""<?xml version="1.0"?>
+    <fcpxml version="1.11">
+        <resources><format id="r1" {format_attrs}/></resources>
+        <library><event name="E"><project name="P">
+            <sequence format="r1" duration="100s"><spine>
+                {spine}
+            </spine></sequence>
+        </project></event></library>
+    </fcpxml>"""
+
+
+@pytest.fixture
+def make_generator(fcpxml_file):
+    """Factory: load a RoughCutGenerator from the session file holding *xml*."""
+    def make(xml):
+        return RoughCutGenerator(fcpxml_file(xml))
+    return make
+
+
 # ============================================================
 # Initialization & Indexing
 # ============================================================
 
 
-def test_detect_fps(generator):
+def test_detect_fps(shared_generator):
     """Should detect 24fps from sample.fcpxml's frameDuration='1/24s'."""
-    assert generator.fps == 24.0
+    assert shared_generator.fps == 24.0
 
 
-def test_detect_fps_default():
+def test_detect_fps_default(make_generator):
     """Should default to 30fps when format has no frameDuration."""
-    xml = """<?xml version="1.0"?>
-    <fcpxml version="1.11">
-        <resources><format id="r1" name="test"/></resources>
-        <library><event name="E"><project name="P">
-            <sequence format="r1" duration="100s"><spine>
-                <asset-clip ref="r1" name="C" duration="10s"/>
-            </spine></sequence>
-        </project></event></library>
-    </fcpxml>"""
-    with tempfile.NamedTemporaryFile(suffix=".fcpxml", mode="w", delete=False) as f:
-        f.write(xml)
-        f.flush()
-        gen = RoughCutGenerator(f.name)
-        assert gen.fps == 30.0
-    Path(f.name).unlink(missing_ok=True)
+    gen = make_generator(_source_xml(
+        '<asset-clip ref="r1" name="C" duration="10s"/>', format_attrs='name="test"'))
+    assert gen.fps == 30.0
 
 
-def test_index_clips_count(generator):
+def test_index_clips_count(shared_generator):
     """Sample has 9 asset-clips in spine — all should be indexed."""
-    assert len(generator.clips) == 9
+    assert len(shared_generator.clips) == 9
 
 
-def test_index_clips_extracts_names(generator):
+def test_index_clips_extracts_names(shared_generator):
     """Clip names should match the FCPXML source."""
-    names = [c["name"] for c in generator.clips]
+    names = [c["name"] for c in shared_generator.clips]
     assert "Interview_A" in names
     assert "Broll_City" in names
     assert "Broll_Studio" in names
 
 
-def test_index_clips_extracts_keywords(generator):
+def test_index_clips_extracts_keywords(shared_generator):
     """Keywords should be extracted from <keyword> children."""
-    interview_clips = [c for c in generator.clips if "Interview" in c["keywords"]]
-    broll_clips = [c for c in generator.clips if "B-Roll" in c["keywords"]]
+    interview_clips = [c for c in shared_generator.clips if "Interview" in c["keywords"]]
+    broll_clips = [c for c in shared_generator.clips if "B-Roll" in c["keywords"]]
     assert len(interview_clips) == 3
     assert len(broll_clips) == 2
 
 
-def test_index_clips_skips_very_short():
+def test_index_clips_interns_keywords(shared_generator):
+    """A keyword repeated across clips is stored as one shared string."""
+    interview = [kw for c in shared_generator.clips for kw in c["keywords"] if kw == "Interview"]
+    assert len(interview) == 3
+    assert all(kw is interview[0] for kw in interview)
+
+
+def test_index_clips_skips_very_short(make_generator):
     """Clips shorter than 0.1s should be skipped by _extract_clip_data."""
+    gen = make_generator(_source_xml(
+        '<asset-clip ref="r1" name="Tiny" duration="1/24s"/>'
+        '<asset-clip ref="r1" name="Normal" duration="48/24s"/>'))
+    names = [c["name"] for c in gen.clips]
+    assert "Normal" in names
+    # 1/24s = 0.0417s < 0.1s threshold, should be skipped
+    assert "Tiny" not in names
+
+
+def test_index_clips_nested_order_and_keywords(make_generator):
+    """Clips are grouped by type in document order, nested ones included."""
     xml = """<?xml version="1.0"?>
     <fcpxml version="1.11">
-        <resources><format id="r1" frameDuration="1/24s"/></resources>
-        <library><event name="E"><project name="P">
-            <sequence format="r1" duration="100s"><spine>
-                <asset-clip ref="r1" name="Tiny" duration="1/24s"/>
-                <asset-clip ref="r1" name="Normal" duration="48/24s"/>
-            </spine></sequence>
-        </project></event></library>
+        <resources><format id="r1" frameDuration="1/25s"/>
+            <asset id="r2" name="A" src="file:///a.mov"><media-rep src="file:///a.mov"/></asset>
+        </resources>
+        <library><event name="E">
+            <clip name="Outer" duration="50/25s">
+                <video ref="r2" name="Inner" duration="50/25s"/>
+                <keyword value="outer-kw"/>
+            </clip>
+            <asset-clip ref="r2" name="First" duration="50/25s"><keyword value="kw"/></asset-clip>
+            <asset-clip ref="r2" name="Second" duration="50/25s"/>
+        </event></library>
     </fcpxml>"""
-    with tempfile.NamedTemporaryFile(suffix=".fcpxml", mode="w", delete=False) as f:
-        f.write(xml)
-        f.flush()
-        gen = RoughCutGenerator(f.name)
-        names = [c["name"] for c in gen.clips]
-        assert "Normal" in names
-        # 1/24s = 0.0417s < 0.1s threshold, should be skipped
-        assert "Tiny" not in names
-    Path(f.name).unlink(missing_ok=True)
-
-
-def test_index_resources(generator):
+    gen = make_generator(xml)
+    assert gen.fps == 25.0
+    assert [c["name"] for c in gen.clips] == ["First", "Second", "Outer", "Inner"]
+    assert gen.clips[0]["keywords"] == ["kw"]
+    assert gen.clips[2]["keywords"] == ["outer-kw"]
+    assert gen.resources["r2"].find("media-rep") is not None
+
+
+def test_index_resources(shared_generator):
     """Should index assets r2, r3, r4 from sample."""
-    assert "r2" in generator.resources
-    assert "r3" in generator.resources
-    assert "r4" in generator.resources
+    assert "r2" in shared_generator.resources
+    assert "r3" in shared_generator.resources
+    assert "r4" in shared_generator.resources
 
 
-def test_index_formats(generator):
+def test_index_formats(shared_generator):
     """Should index format r1 from sample."""
-    assert "r1" in generator.formats
+    assert "r1" in shared_generator.formats
+
+
+def test_source_tree_not_retained(shared_generator):
+    """Only indexed data is kept — no handle on the parsed source document."""
+    assert not hasattr(shared_generator, "tree") and not hasattr(shared_generator, "root")
+    assert all("element" not in clip for clip in shared_generator.clips)
 
 
-def test_extract_clip_data_favorites():
+# Shared by the rating/favorite tests below: one favorited, one rejected,
+# one unrated clip.
+RATED_SPINE = (
+    '<asset-clip ref="r1" name="Fav" duration="48/24s" rating="1"/>'
+    '<asset-clip ref="r1" name="Rej" duration="48/24s" rating="-1"/>'
+    '<asset-clip ref="r1" name="Neutral" duration="48/24s"/>'
+)
+
+
+def test_extract_clip_data_favorites(make_generator):
     """Should detect favorited and rejected clips."""
-    xml = """<?xml version="1.0"?>
-    <fcpxml version="1.11">
-        <resources><format id="r1" frameDuration="1/24s"/></resources>
-        <library><event name="E"><project name="P">
-            <sequence format="r1" duration="100s"><spine>
-                <asset-clip ref="r1" name="Fav" duration="48/24s" rating="1"/>
-                <asset-clip ref="r1" name="Rej" duration="48/24s" rating="-1"/>
-                <asset-clip ref="r1" name="Neutral" duration="48/24s"/>
-            </spine></sequence>
-        </project></event></library>
-    </fcpxml>"""
-    with tempfile.NamedTemporaryFile(suffix=".fcpxml", mode="w", delete=False) as f:
-        f.write(xml)
-        f.flush()
-        gen = RoughCutGenerator(f.name)
-        by_name = {c["name"]: c for c in gen.clips}
-        assert by_name["Fav"]["is_favorite"] is True
-        assert by_name["Fav"]["is_rejected"] is False
-        assert by_name["Rej"]["is_rejected"] is True
-        assert by_name["Neutral"]["is_favorite"] is False
-        assert by_name["Neutral"]["is_rejected"] is False
-    Path(f.name).unlink(missing_ok=True)
+    gen = make_generator(_source_xml(RATED_SPINE))
+    by_name = {c["name"]: c for c in gen.clips}
+    assert by_name["Fav"]["is_favorite"] is True
+    assert by_name["Fav"]["is_rejected"] is False
+    assert by_name["Rej"]["is_rejected"] is True
+    assert by_name["Neutral"]["is_favorite"] is False
+    assert by_name["Neutral"]["is_rejected"] is False
 
 
 # ============================================================
@@ -162,39 +214,39 @@ def test_extract_clip_data_favorites():
 # ============================================================
 
 
-def test_parse_duration_shorthand_minutes(generator):
+def test_parse_duration_shorthand_minutes(shared_generator):
     """'3m' should parse to 180 seconds."""
-    tv = generator._parse_duration("3m")
+    tv = shared_generator._parse_duration("3m")
     assert abs(tv.to_seconds() - 180.0) < 0.1
 
 
-def test_parse_duration_shorthand_minutes_seconds(generator):
+def test_parse_duration_shorthand_minutes_seconds(shared_generator):
     """'3m30s' should parse to 210 seconds."""
-    tv = generator._parse_duration("3m30s")
+    tv = shared_generator._parse_duration("3m30s")
     assert abs(tv.to_seconds() - 210.0) < 0.1
 
 
-def test_parse_duration_shorthand_minutes_only_trailing_s(generator):
+def test_parse_duration_shorthand_minutes_only_trailing_s(shared_generator):
     """'2m' should parse to 120 seconds (no trailing 's' after empty seconds)."""
-    tv = generator._parse_duration("2m")
+    tv = shared_generator._parse_duration("2m")
     assert abs(tv.to_seconds() - 120.0) < 0.1
 
 
-def test_parse_duration_timecode(generator):
+def test_parse_duration_timecode(shared_generator):
     """'00:00:10:00' timecode should parse to 10 seconds at 24fps."""
-    tv = generator._parse_duration("00:00:10:00")
+    tv = shared_generator._parse_duration("00:00:10:00")
     assert abs(tv.to_seconds() - 10.0) < 0.1
 
 
-def test_parse_duration_rational(generator):
+def test_parse_duration_rational(shared_generator):
     """'240/24s' should parse to 10 seconds."""
-    tv = generator._parse_duration("240/24s")
+    tv = shared_generator._parse_duration("240/24s")
     assert abs(tv.to_seconds() - 10.0) < 0.1
 
 
-def test_parse_duration_fractional_seconds(generator):
+def test_parse_duration_fractional_seconds(shared_generator):
     """'1m30.5s' should parse to 90.5 seconds, not crash."""
-    tv = generator._parse_duration("1m30.5s")
+    tv = shared_generator._parse_duration("1m30.5s")
     assert abs(tv.to_seconds() - 90.5) < 0.5
 
 
@@ -203,92 +255,59 @@ def test_parse_duration_fractional_seconds(generator):
 # ============================================================
 
 
-def test_filter_clips_no_filters(generator):
+def test_filter_clips_no_filters(shared_generator):
     """No filters should return all non-rejected clips (sample has none rejected)."""
-    result = generator._filter_clips()
+    result = shared_generator._filter_clips()
     assert len(result) == 9
 
 
-def test_filter_clips_by_keyword(generator):
+def test_filter_clips_by_keyword(shared_generator):
     """Filtering by 'Interview' keyword should return 3 clips."""
-    result = generator._filter_clips(keywords=["Interview"])
+    result = shared_generator._filter_clips(keywords=["Interview"])
     assert len(result) == 3
     for clip in result:
         assert "Interview" in clip["keywords"]
 
 
-def test_filter_clips_keyword_case_insensitive(generator):
+def test_filter_clips_keyword_case_insensitive(shared_generator):
     """Keyword filtering should be case-insensitive."""
-    result = generator._filter_clips(keywords=["interview"])
+    result = shared_generator._filter_clips(keywords=["interview"])
     assert len(result) == 3
 
 
-def test_filter_clips_exclude_rejected():
-    """Should exclude rejected clips when exclude_rejected=True."""
-    xml = """<?xml version="1.0"?>
-    <fcpxml version="1.11">
-        <resources><format id="r1" frameDuration="1/24s"/></resources>
-        <library><event name="E"><project name="P">
-            <sequence format="r1" duration="100s"><spine>
-                <asset-clip ref="r1" name="Good" duration="48/24s"/>
-                <asset-clip ref="r1" name="Bad" duration="48/24s" rating="-1"/>
-            </spine></sequence>
-        </project></event></library>
-    </fcpxml>"""
-    with tempfile.NamedTemporaryFile(suffix=".fcpxml", mode="w", delete=False) as f:
-        f.write(xml)
-        f.flush()
-        gen = RoughCutGenerator(f.name)
-        result = gen._filter_clips(exclude_rejected=True)
-        names = [c["name"] for c in result]
-        assert "Good" in names
-        assert "Bad" not in names
-    Path(f.name).unlink(missing_ok=True)
-
-
-def test_filter_clips_include_rejected():
-    """Should include rejected clips when exclude_rejected=False."""
-    xml = """<?xml version="1.0"?>
-    <fcpxml version="1.11">
-        <resources><format id="r1" frameDuration="1/24s"/></resources>
-        <library><event name="E"><project name="P">
-            <sequence format="r1" duration="100s"><spine>
-                <asset-clip ref="r1" name="Good" duration="48/24s"/>
-                <asset-clip ref="r1" name="Bad" duration="48/24s" rating="-1"/>
-            </spine></sequence>
-        </project></event></library>
-    </fcpxml>"""
-    with tempfile.NamedTemporaryFile(suffix=".fcpxml", mode="w", delete=False) as f:
-        f.write(xml)
-        f.flush()
-        gen = RoughCutGenerator(f.name)
-        result = gen._filter_clips(exclude_rejected=False)
-        names = [c["name"] for c in result]
-        assert "Good" in names
-        assert "Bad" in names
-    Path(f.name).unlink(missing_ok=True)
-
-
-def test_filter_clips_favorites_only():
+def test_filter_clips_any_keyword_in_clip_order(shared_generator):
+    """Multiple keywords match clips carrying any of them, in source order."""
+    result = shared_generator._filter_clips(keywords=["b-roll", "INTERVIEW", "missing"])
+    assert len(result) == 5
+    positions = [shared_generator.clips.index(c) for c in result]
+    assert positions == sorted(positions)
+
+
+def test_filter_clips_keyword_index_tracks_new_clips(generator):
+    """Appending to clips rebuilds the keyword index on the next filter."""
+    assert generator._filter_clips(keywords=["late"]) == []
+    extra = dict(generator.clips[0], name="Late", keywords=["Late"])
+    generator.clips.append(extra)
+    assert generator._filter_clips(keywords=["late"]) == [extra]
+
+
+@pytest.mark.parametrize("exclude_rejected,expected", [
+    (True, ["Fav", "Neutral"]),
+    (False, ["Fav", "Rej", "Neutral"]),
+])
+def test_filter_clips_rejected(make_generator, exclude_rejected, expected):
+    """Rejected clips are dropped only when exclude_rejected=True."""
+    gen = make_generator(_source_xml(RATED_SPINE))
+    result = gen._filter_clips(exclude_rejected=exclude_rejected)
+    assert [c["name"] for c in result] == expected
+
+
+def test_filter_clips_favorites_only(make_generator):
     """Should return only favorited clips when favorites_only=True."""
-    xml = """<?xml version="1.0"?>
-    <fcpxml version="1.11">
-        <resources><format id="r1" frameDuration="1/24s"/></resources>
-        <library><event name="E"><project name="P">
-            <sequence format="r1" duration="100s"><spine>
-                <asset-clip ref="r1" name="Fav" duration="48/24s" rating="1"/>
-                <asset-clip ref="r1" name="Neutral" duration="48/24s"/>
-            </spine></sequence>
-        </project></event></library>
-    </fcpxml>"""
-    with tempfile.NamedTemporaryFile(suffix=".fcpxml", mode="w", delete=False) as f:
-        f.write(xml)
-        f.flush()
-        gen = RoughCutGenerator(f.name)
-        result = gen._filter_clips(favorites_only=True)
-        assert len(result) == 1
-        assert result[0]["name"] == "Fav"
-    Path(f.name).unlink(missing_ok=True)
+    gen = make_generator(_source_xml(RATED_SPINE))
+    result = gen._filter_clips(favorites_only=True)
+    assert len(result) == 1
+    assert result[0]["name"] == "Fav"
 
 
 # ============================================================
@@ -296,22 +315,22 @@ def test_filter_clips_favorites_only():
 # ============================================================
 
 
-def test_select_clips_simple_respects_target(generator):
+def test_select_clips_simple_respects_target(shared_generator):
     """Should stop selecting when target duration is reached."""
-    clips = generator._filter_clips()
-    target = TimeValue.from_seconds(5.0, generator.fps)
+    clips = shared_generator._filter_clips()
+    target = TimeValue.from_seconds(5.0, shared_generator.fps)
     pacing = PacingConfig(pacing="medium")
-    selected = generator._select_clips_simple(clips, target, pacing, "best")
+    selected = shared_generator._select_clips_simple(clips, target, pacing, "best")
     total = sum(c["use_duration"].to_seconds() for c in selected)
     assert total <= 6.0  # Should be close to 5s target
 
 
-def test_select_clips_simple_priority_longest(generator):
+def test_select_clips_simple_priority_longest(shared_generator):
     """Priority 'longest' should select longest clips first."""
-    clips = generator._filter_clips()
-    target = TimeValue.from_seconds(60.0, generator.fps)
+    clips = shared_generator._filter_clips()
+    target = TimeValue.from_seconds(60.0, shared_generator.fps)
     pacing = PacingConfig(pacing="slow")
-    selected = generator._select_clips_simple(clips, target, pacing, "longest")
+    selected = shared_generator._select_clips_simple(clips, target, pacing, "longest")
     # First selected clip should be the longest available
     assert len(selected) > 0
     durations = [c["use_duration"].to_seconds() for c in selected]
@@ -320,21 +339,50 @@ def test_select_clips_simple_priority_longest(generator):
         assert durations[0] >= durations[1] - 0.1  # tolerance for pacing clamp
 
 
-def test_select_clips_simple_priority_shortest(generator):
+def test_select_clips_simple_duration_priorities_are_stable(make_generator):
+    """Longest/shortest order by the cached seconds; equal durations keep clip order."""
+    gen = make_generator(_source_xml(
+        '<asset-clip ref="r1" name="A" duration="48/24s"/>'
+        '<asset-clip ref="r1" name="Long" duration="96/24s"/>'
+        '<asset-clip ref="r1" name="B" duration="48/24s"/>'))
+    assert [c["seconds"] for c in gen.clips] == [2.0, 4.0, 2.0]
+    target = TimeValue.from_seconds(60.0, gen.fps)
+    pacing = PacingConfig(pacing="slow")
+    for priority, expected in (("longest", ["Long", "A", "B"]), ("shortest", ["A", "B", "Long"])):
+        selected = gen._select_clips_simple(gen._filter_clips(), target, pacing, priority)
+        assert [c["name"] for c in selected] == expected
+
+
+def test_select_clips_simple_best_puts_favorites_first(make_generator):
+    """'best' and 'favorites': favorites first, then longest; ties keep clip order."""
+    gen = make_generator(_source_xml(
+        '<asset-clip ref="r1" name="A" duration="48/24s"/>'
+        '<asset-clip ref="r1" name="FavShort" duration="48/24s" rating="1"/>'
+        '<asset-clip ref="r1" name="Long" duration="96/24s"/>'
+        '<asset-clip ref="r1" name="FavLong" duration="96/24s" rating="1"/>'
+        '<asset-clip ref="r1" name="B" duration="48/24s"/>'))
+    target = TimeValue.from_seconds(60.0, gen.fps)
+    pacing = PacingConfig(pacing="slow")
+    for priority in ("best", "favorites"):
+        selected = gen._select_clips_simple(gen._filter_clips(), target, pacing, priority)
+        assert [c["name"] for c in selected] == ["FavLong", "FavShort", "Long", "A", "B"]
+
+
+def test_select_clips_simple_priority_shortest(shared_generator):
     """Priority 'shortest' should select shortest clips first."""
-    clips = generator._filter_clips()
-    target = TimeValue.from_seconds(60.0, generator.fps)
+    clips = shared_generator._filter_clips()
+    target = TimeValue.from_seconds(60.0, shared_generator.fps)
     pacing = PacingConfig(pacing="fast")
-    selected = generator._select_clips_simple(clips, target, pacing, "shortest")
+    selected = shared_generator._select_clips_simple(clips, target, pacing, "shortest")
     assert len(selected) > 0
 
 
-def test_select_clips_simple_adds_in_out_points(generator):
+def test_select_clips_simple_adds_in_out_points(shared_generator):
     """Selected clips should have in_point and out_point set."""
-    clips = generator._filter_clips()
-    target = TimeValue.from_seconds(10.0, generator.fps)
+    clips = shared_generator._filter_clips()
+    target = TimeValue.from_seconds(10.0, shared_generator.fps)
     pacing = PacingConfig(pacing="medium")
-    selected = generator._select_clips_simple(clips, target, pacing, "best")
+    selected = shared_generator._select_clips_simple(clips, target, pacing, "best")
     for clip in selected:
         assert "in_point" in clip
         assert "out_point" in clip
@@ -483,39 +531,25 @@ def test_generate_with_segments(generator, temp_output):
     assert result.clips_used > 0
 
 
-def test_generate_output_is_valid_xml(generator, temp_output):
+def test_generate_output_is_valid_xml(ten_second_cut):
     """Output FCPXML should be parseable XML with correct structure."""
-    generator.generate(output_path=temp_output, target_duration="10s")
-    tree = ET.parse(temp_output)
-    root = tree.getroot()
+    root = ET.parse(ten_second_cut).getroot()
     assert root.tag == "fcpxml"
     assert root.find(".//spine") is not None
     assert len(root.findall(".//asset-clip")) > 0
 
 
-def test_generate_favorites_only(temp_output):
+def test_generate_favorites_only(make_generator, temp_output):
     """favorites_only=True with no favorites should raise ValueError."""
-    xml = """<?xml version="1.0"?>
-    <fcpxml version="1.11">
-        <resources><format id="r1" frameDuration="1/24s"/></resources>
-        <library><event name="E"><project name="P">
-            <sequence format="r1" duration="100s"><spine>
-                <asset-clip ref="r1" name="C1" duration="48/24s"/>
-                <asset-clip ref="r1" name="C2" duration="48/24s"/>
-            </spine></sequence>
-        </project></event></library>
-    </fcpxml>"""
-    with tempfile.NamedTemporaryFile(suffix=".fcpxml", mode="w", delete=False) as f:
-        f.write(xml)
-        f.flush()
-        gen = RoughCutGenerator(f.name)
-        with pytest.raises(ValueError, match="No clips match"):
-            gen.generate(
-                output_path=temp_output,
-                target_duration="5s",
-                favorites_only=True,
-            )
-    Path(f.name).unlink(missing_ok=True)
+    gen = make_generator(_source_xml(
+        '<asset-clip ref="r1" name="C1" duration="48/24s"/>'
+        '<asset-clip ref="r1" name="C2" duration="48/24s"/>'))
+    with pytest.raises(ValueError, match="No clips match"):
+        gen.generate(
+            output_path=temp_output,
+            target_duration="5s",
+            favorites_only=True,
+        )
 
 
 # ============================================================
@@ -523,11 +557,9 @@ def test_generate_favorites_only(temp_output):
 # ============================================================
 
 
-def test_build_output_xml_structure(generator, temp_output):
+def test_build_output_xml_structure(ten_second_cut):
     """Output should have fcpxml > resources, library > event > project > sequence > spine."""
-    generator.generate(output_path=temp_output, target_duration="10s")
-    tree = ET.parse(temp_output)
-    root = tree.getroot()
+    root = ET.parse(ten_second_cut).getroot()
     assert root.find("resources") is not None
     assert root.find("library") is not None
     assert root.find(".//event") is not None
@@ -549,12 +581,10 @@ def test_build_output_copies_resources(generator, temp_output):
     assert resources.find("format") is not None
 
 
-def test_build_output_doctype(generator, temp_output):
+def test_build_output_doctype(ten_second_cut):
     """Output should start with XML declaration and DOCTYPE."""
-    generator.generate(output_path=temp_output, target_duration="10s")
-    content = Path(temp_output).read_text()
-    assert '<?xml version="1.0" encoding="UTF-8"?>' in content
-    assert "<!DOCTYPE fcpxml>" in content
+    head = Path(ten_second_cut).read_bytes()[:128]
+    assert head.startswith(b'<?xml version="1.0" encoding="UTF-8"?>\n<!DOCTYPE fcpxml>\n')
 
 
 # ============================================================
@@ -562,15 +592,15 @@ def test_build_output_doctype(generator, temp_output):
 # ============================================================
 
 
-def test_build_ab_sequence_alternates(generator):
+def test_build_ab_sequence_alternates(shared_generator):
     """A/B sequence should alternate between roll types."""
-    a_clips = generator._filter_clips(keywords=["Interview"])
-    b_clips = generator._filter_clips(keywords=["B-Roll"])
-    target = TimeValue.from_seconds(20.0, generator.fps)
-    a_dur = TimeValue.from_seconds(5.0, generator.fps)
-    b_dur = TimeValue.from_seconds(3.0, generator.fps)
+    a_clips = shared_generator._filter_clips(keywords=["Interview"])
+    b_clips = shared_generator._filter_clips(keywords=["B-Roll"])
+    target = TimeValue.from_seconds(20.0, shared_generator.fps)
+    a_dur = TimeValue.from_seconds(5.0, shared_generator.fps)
+    b_dur = TimeValue.from_seconds(3.0, shared_generator.fps)
 
-    selected = generator._build_ab_sequence(
+    selected = shared_generator._build_ab_sequence(
         a_clips, b_clips, target, a_dur, b_dur, "a"
     )
 
@@ -579,31 +609,31 @@ def test_build_ab_sequence_alternates(generator):
     assert selected[1]["roll_type"] == "B"
 
 
-def test_build_ab_sequence_starts_with_b(generator):
+def test_build_ab_sequence_starts_with_b(shared_generator):
     """start_with='b' should begin with B-roll."""
-    a_clips = generator._filter_clips(keywords=["Interview"])
-    b_clips = generator._filter_clips(keywords=["B-Roll"])
-    target = TimeValue.from_seconds(10.0, generator.fps)
-    a_dur = TimeValue.from_seconds(3.0, generator.fps)
-    b_dur = TimeValue.from_seconds(3.0, generator.fps)
+    a_clips = shared_generator._filter_clips(keywords=["Interview"])
+    b_clips = shared_generator._filter_clips(keywords=["B-Roll"])
+    target = TimeValue.from_seconds(10.0, shared_generator.fps)
+    a_dur = TimeValue.from_seconds(3.0, shared_generator.fps)
+    b_dur = TimeValue.from_seconds(3.0, shared_generator.fps)
 
-    selected = generator._build_ab_sequence(
+    selected = shared_generator._build_ab_sequence(
         a_clips, b_clips, target, a_dur, b_dur, "b"
     )
 
     assert selected[0]["roll_type"] == "B"
 
 
-def test_build_ab_sequence_loops_clips(generator):
+def test_build_ab_sequence_loops_clips(shared_generator):
     """Should loop clips when pool is exhausted before target duration."""
-    a_clips = generator._filter_clips(keywords=["Interview"])  # 3 clips
-    b_clips = generator._filter_clips(keywords=["B-Roll"])  # 2 clips
+    a_clips = shared_generator._filter_clips(keywords=["Interview"])  # 3 clips
+    b_clips = shared_generator._filter_clips(keywords=["B-Roll"])  # 2 clips
     # Set a long target to force looping
-    target = TimeValue.from_seconds(120.0, generator.fps)
-    a_dur = TimeValue.from_seconds(3.0, generator.fps)
-    b_dur = TimeValue.from_seconds(3.0, generator.fps)
+    target = TimeValue.from_seconds(120.0, shared_generator.fps)
+    a_dur = TimeValue.from_seconds(3.0, shared_generator.fps)
+    b_dur = TimeValue.from_seconds(3.0, shared_generator.fps)
 
-    selected = generator._build_ab_sequence(
+    selected = shared_generator._build_ab_sequence(
         a_clips, b_clips, target, a_dur, b_dur, "a"
     )
 
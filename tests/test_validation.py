@@ -75,6 +75,23 @@ def test_dtd_insert_preserves_between_existing():
     assert tags == ["note", "conform-rate", "marker", "filter-video"]
 
 
+def test_dtd_insert_repeated_markers_keep_insertion_order():
+    """Each new marker lands after the earlier ones, still ahead of trailing filters."""
+    clip = ET.Element("asset-clip")
+    ET.SubElement(clip, "adjust-volume")
+    ET.SubElement(clip, "filter-video")
+    ET.SubElement(clip, "metadata")
+    for i in range(3):
+        _dtd_insert(clip, ET.Element("marker", value=str(i)))
+    _dtd_insert(clip, ET.Element("chapter-marker", value="ch"))
+    assert [(c.tag, c.get("value")) for c in clip] == [
+        ("adjust-volume", None),
+        ("marker", "0"), ("marker", "1"), ("marker", "2"),
+        ("chapter-marker", "ch"),
+        ("filter-video", None), ("metadata", None),
+    ]
+
+
 # ── _check_child_order: DTD ordering violations ─────────────────────
 
 
@@ -15,12 +15,11 @@ SAMPLE = Path(__file__).parent.parent / "examples" / "sample.fcpxml"
 
 
 @pytest.fixture
-def temp_fcpxml():
+def temp_fcpxml(tmp_path):
     """Create a temp copy of sample.fcpxml for modification tests."""
-    with tempfile.NamedTemporaryFile(suffix='.fcpxml', delete=False) as f:
-        shutil.copy(SAMPLE, f.name)
-        yield f.name
-    Path(f.name).unlink(missing_ok=True)
+    path = tmp_path / "sample.fcpxml"
+    shutil.copy(SAMPLE, path)
+    return str(path)
 
 
 # ============================================================
@@ -174,9 +173,6 @@ def test_insert_clip_saves_correctly(temp_fcpxml):
     project = parser.parse_file(output)
     reloaded_clip_count = len(project.primary_timeline.clips)
 
-    # Clean up
-    Path(output).unlink(missing_ok=True)
-
     assert reloaded_clip_count == initial_count + 1
 
 